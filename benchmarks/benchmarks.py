@@ -0,0 +1,320 @@
+#
+# Copyright (c) 2016 Alessandro Pietro Bardelli
+#
+
+"""
+Benchmarks of the OrthoProj entry points, run with airspeed velocity
+(https://asv.readthedocs.io).
+
+Every plotting call is measured on 1e3 to 1e7 points for:
+
+    time_build. Time spent by the call itself.
+    peakmem_build. Peak memory of a process only making the call (in the
+        *Memory classes, whose setup generates the data and nothing else).
+    time_draw. Time to draw the whole figure with Agg.
+    time_savefig. Time to save the figure as PNG.
+    time_sync. Latency of a zoom: the new limits are synchronised on all
+        the axis and the level-of-detail lines are refreshed (the density
+        images are binned again when drawn).
+    track_artists. Number of data artists in the figure.
+
+Combinations that cannot run in a reasonable time (e.g. 1e7 markers) are
+skipped. The results are stored as JSON in .asv/results: ``asv continuous
+master HEAD`` or ``asv compare`` report the regressions between commits.
+"""
+# pylint: disable=invalid-name,protected-access,attribute-defined-outside-init
+import numpy as np
+from orthoproj import OrthoProj
+
+SIZES = [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7]
+
+
+# #################################
+# Functions to generate sample data
+# #################################
+
+def helix_data(n):
+    t = np.linspace(0, 20 * np.pi, n)
+    return np.cos(t), np.sin(t), t / (20 * np.pi)
+
+
+def cloud_data(n):
+    return np.random.RandomState(0).standard_normal((3, n))
+
+
+def grid_data(n):
+    side = max(int(np.sqrt(n)), 2)
+    X, Y = np.meshgrid(np.linspace(-1, 1, side), np.linspace(-1, 1, side))
+    R = np.hypot(X, Y)
+    return X, Y, np.sin(6 * R) / (1 + R)
+
+
+def polygon_data(n):
+    t = np.linspace(0, 2 * np.pi, n, endpoint=False)
+    r = 1 + 0.2 * np.sin(7 * t)
+    return r * np.cos(t), r * np.sin(t), 0.2 * np.cos(3 * t)
+
+
+def quads_data(n):
+    X, Y, Z = grid_data(n)
+    grid = np.stack((X, Y, Z), axis=-1)
+    return np.stack((grid[:-1, :-1], grid[:-1, 1:], grid[1:, 1:], grid[1:, :-1]),
+                    axis=-2).reshape(-1, 4, 3)
+
+
+def volume_data(n):
+    side = max(int(round(n ** (1. / 3))), 2)
+    x, y, z = np.ogrid[-1:1:side * 1j, -1:1:side * 1j, -1:1:side * 1j]
+    return np.exp(-4 * ((x - .3) ** 2 + y ** 2 / 0.2 + (z + .2) ** 2))
+
+
+# ##########
+# Benchmarks
+# ##########
+
+class Construction():
+    '''
+    Creation of an empty OrthoProj.
+    '''
+
+    def time_init(self):
+        OrthoProj(headless=True).close()
+
+    def peakmem_init(self):
+        OrthoProj(headless=True).close()
+
+    def time_draw(self):
+        proj = OrthoProj(headless=True)
+        proj._fig.canvas.draw()
+        proj.close()
+
+
+class _Call():
+    '''
+    A plotting call measured on every number of points. Subclasses set
+    params (the first one being the number of points), build the data in
+    data and make the call in build.
+    '''
+    params = [SIZES]
+    param_names = ['points']
+    number = 1
+    repeat = (1, 5, 60.)
+    timeout = 600
+
+    # (points, *params) combinations that are skipped
+    skip = ()
+
+    def data(self, n, *params):
+        raise NotImplementedError
+
+    def build(self, proj, *params):
+        raise NotImplementedError
+
+    def setup(self, n, *params):
+        if any(n >= size and tuple(params[:len(other)]) == other
+               for size, other in self.skip):
+            raise NotImplementedError  # asv skips the benchmark
+        self.args = self.data(n, *params)
+
+
+class _Entry(_Call):
+    '''
+    Benchmarks of a call on an empty figure and of the figure it made.
+    '''
+
+    def setup(self, n, *params):
+        _Call.setup(self, n, *params)
+        self.empty = OrthoProj(headless=True)
+        self.proj = OrthoProj(headless=True)
+        self.build(self.proj, *params)
+        self.proj._fig.canvas.draw()
+
+    def teardown(self, *params):
+        self.empty.close()
+        self.proj.close()
+
+    def time_build(self, *params):
+        self.build(self.empty, *params[1:])
+
+    def time_draw(self, *params):
+        self.proj._fig.canvas.draw()
+
+    def time_savefig(self, *params):
+        self.proj.to_bytes('png')
+
+    def time_sync(self, *params):
+        limits = self.proj.limits
+        limits.set(*[((3 * low + high) / 4, (low + 3 * high) / 4)
+                     for low, high in (limits.x, limits.y, limits.z)])
+
+    def track_artists(self, *params):
+        axes = [self.proj._axisXZ, self.proj._axisYZ, self.proj._axisXY, self.proj._axis3D]
+        return sum(len(axis.lines) + len(axis.collections) + len(axis.images) +
+                   len(axis.patches) for axis in axes)
+    track_artists.unit = 'artists'
+
+
+class _Memory(_Call):
+    '''
+    Peak memory of a call. The peak of the process includes its setup,
+    which only generates the data.
+    '''
+
+    def peakmem_build(self, *params):
+        proj = OrthoProj(headless=True)
+        self.build(proj, *params[1:])
+        proj.close()
+
+
+class _Plot(_Call):
+    params = [SIZES, [False, True]]
+    param_names = ['points', 'lod']
+
+    def data(self, n, *params):
+        return helix_data(n)
+
+    def build(self, proj, lod):
+        proj.plot(*self.args, lod=lod)
+
+
+class _Scatter(_Call):
+    params = [SIZES, ['points', 'density']]
+    param_names = ['points', 'mode']
+    skip = ((10 ** 6, ('points',)),)
+
+    def data(self, n, *params):
+        return cloud_data(n)
+
+    def build(self, proj, mode):
+        proj.scatter(*self.args, mode=mode)
+
+
+class _PlotSurface(_Call):
+    params = [SIZES, ['wireframe', 'outline']]
+    param_names = ['points', 'mode']
+    skip = ((10 ** 7, ('outline',)),)
+
+    def data(self, n, *params):
+        return grid_data(n)
+
+    def build(self, proj, mode):
+        proj.plot_surface(*self.args, mode=mode)
+
+
+class _PlotWireframe(_Call):
+
+    def data(self, n, *params):
+        return grid_data(n)
+
+    def build(self, proj):
+        proj.plot_wireframe(*self.args)
+
+
+class _PlotTrisurf(_Call):
+    skip = ((10 ** 7, ()),)
+
+    def data(self, n, *params):
+        X, Y, Z = grid_data(n)
+        side = len(X)
+        corners = np.arange(side * side).reshape(side, side)
+        a, b = corners[:-1, :-1].ravel(), corners[:-1, 1:].ravel()
+        c, d = corners[1:, 1:].ravel(), corners[1:, :-1].ravel()
+        triangles = np.concatenate((np.column_stack((a, b, c)), np.column_stack((a, c, d))))
+        return X.ravel(), Y.ravel(), Z.ravel(), triangles
+
+    def build(self, proj):
+        proj.plot_trisurf(*self.args)
+
+
+class _PlotCollection(_Call):
+
+    def data(self, n, *params):
+        return polygon_data(n)
+
+    def build(self, proj):
+        proj.plot_collection(*self.args)
+
+
+class _PlotCollections(_Call):
+    skip = ((10 ** 7, ()),)
+
+    def data(self, n, *params):
+        return quads_data(n // 4)
+
+    def build(self, proj):
+        proj.plot_collections(self.args)
+
+
+class _Volume(_Call):
+    params = [SIZES, ['max', 'mean']]
+    param_names = ['points', 'reduce']
+
+    def data(self, n, *params):
+        return volume_data(n)
+
+    def build(self, proj, reduce):
+        proj.volume(self.args, reduce=reduce)
+
+
+class Plot(_Plot, _Entry):
+    pass
+
+
+class PlotMemory(_Plot, _Memory):
+    pass
+
+
+class Scatter(_Scatter, _Entry):
+    pass
+
+
+class ScatterMemory(_Scatter, _Memory):
+    pass
+
+
+class PlotSurface(_PlotSurface, _Entry):
+    pass
+
+
+class PlotSurfaceMemory(_PlotSurface, _Memory):
+    pass
+
+
+class PlotWireframe(_PlotWireframe, _Entry):
+    pass
+
+
+class PlotWireframeMemory(_PlotWireframe, _Memory):
+    pass
+
+
+class PlotTrisurf(_PlotTrisurf, _Entry):
+    pass
+
+
+class PlotTrisurfMemory(_PlotTrisurf, _Memory):
+    pass
+
+
+class PlotCollection(_PlotCollection, _Entry):
+    pass
+
+
+class PlotCollectionMemory(_PlotCollection, _Memory):
+    pass
+
+
+class PlotCollections(_PlotCollections, _Entry):
+    pass
+
+
+class PlotCollectionsMemory(_PlotCollections, _Memory):
+    pass
+
+
+class Volume(_Volume, _Entry):
+    pass
+
+
+class VolumeMemory(_Volume, _Memory):
+    pass
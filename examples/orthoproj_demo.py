@@ -88,15 +88,11 @@ example.scatter(x / 10, y / 5, z / 12.,
 x, y, z = helix_data(radius=0.25, offset=(0, 0, 1))
 example.plot(x, y, z, kwargsShared={"linewidth": 2, "alpha": 0.9, "color": "r"})
 
-# plot a cube as collection of faces
+# plot a cube as collection of faces (sorted by depth in the 2D views)
 x, y, z = cube_data(0.5, offset=(-0.25, -0.25, 0.25))
 faces = 6.
-for i in range(int(faces)):
-    example.plot_collection(x[i], y[i], z[i],
-                            kwargsXZ={'zorder': -min(y[i])},
-                            kwargsYZ={'zorder': -min(x[i])},
-                            kwargsXY={'zorder': max(z[i])},
-                            kwargsShared={"facecolor": cm.jet(i / faces)})
+example.plot_collections(np.stack((x, y, z), axis=-1),
+                         kwargsShared={"facecolors": cm.jet(np.arange(faces) / faces)})
 
 # not blocking show
 example.show(block=False)
@@ -2,10 +2,14 @@
 Orthoproj
 """
 
-from .orthogonal_projection import OrthoProj
+from .orthogonal_projection import OrthoProj, DataHandle, LimitSync
+from .render import (render, render_many, render_async, RenderResult, RenderCache,
+                     RenderPool)
 try:
     from orthoproj.version import version as __version__
 except:
     __version__ = "UNKNOWN"
 
-__all__ = ["OrthoProj"]
+__all__ = ["OrthoProj", "DataHandle", "LimitSync",
+           "render", "render_many", "render_async", "RenderResult", "RenderCache",
+           "RenderPool"]
@@ -1,374 +1,3180 @@
-# Copyright (c) 2016 Alessandro Pietro Bardelli
-#
-# Permission is hereby granted, free of charge, to any person obtaining a copy
-# of this software and associated documentation files (the "Software"), to deal
-# in the Software without restriction, including without limitation the rights
-# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
-# copies of the Software, and to permit persons to whom the Software is
-# furnished to do so, subject to the following conditions:
-#
-# The above copyright notice and this permission notice shall be included in all
-# copies or substantial portions of the Software.
-#
-# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
-# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
-# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
-# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
-# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
-# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
-# SOFTWARE.
-
-"""
-Module containing OrthoProj, a class which can create an Orthogonal Projection
-of 3D data with full axes synchronisation.
-"""
-# pylint: disable=undefined-variable, invalid-name, eval-used
-import types
-import itertools
-from textwrap import dedent
-import matplotlib.pyplot as plt
-from mpl_toolkits.mplot3d.art3d import Poly3DCollection
-from matplotlib.collections import PolyCollection
-from six.moves import input
-
-# This generates all sync_A_with_B(self, axis) functions that are used to
-# synchronise the axis of two plots
-for src, trg in itertools.product(['x', 'y', 'z'], repeat=2):
-    eval(compile(dedent("""
-        def sync_{0}_with_{1}(self, axis):
-            if((axis.get_{1}lim()[0] > axis.get_{1}lim()[1]) !=
-               (self.get_{0}lim()[0] > self.get_{0}lim()[1])):
-                self.set_{0}lim(axis.get_{1}lim()[::-1], emit=False)
-            else:
-                self.set_{0}lim(axis.get_{1}lim(), emit=False)
-        """).format(src, trg), '<string>', 'exec'))
-
-
-def _merge_dicts(*dict_args):
-    '''
-    Given any number of dicts, shallow copy and merge into a new dict,
-    precedence goes to key value pairs in latter dicts.
-    '''
-    result = {}
-    for dictionary in dict_args:
-        if dictionary is not None:
-            result.update(dictionary)
-    return result
-
-
-class OrthoProj():
-    """
-    Orthogonal Projection object.
-    """
-
-    _fig = None
-    _locked = None
-    _axisXZ = None
-    _axisYZ = None
-    _axisXY = None
-    _axis3D = None
-
-    def __init__(self, title=None):
-        """
-        Build an :class:`OrthoProj` object
-
-        Args:
-            title (string). The title string for the orthogonal projection figure.
-            Default: None, i.e., default naming
-
-        """
-
-        fig = plt.figure(title)
-        axisXZ = fig.add_subplot(221, title="Vertical Plane - XZ")
-        axisYZ = fig.add_subplot(222, title="Lateral Plane - YZ")
-        axisXY = fig.add_subplot(223, title="Horizontal Plane - XY")
-        axis3D = fig.add_subplot(224, title="3D view - XYZ", projection="3d")
-
-        for ax in [axisXZ, axisYZ, axisXY, axis3D]:
-            ax.sync_x_with_x = types.MethodType(sync_x_with_x, ax)
-            ax.sync_x_with_y = types.MethodType(sync_x_with_y, ax)
-            ax.sync_x_with_z = types.MethodType(sync_x_with_z, ax)
-            ax.sync_y_with_x = types.MethodType(sync_y_with_x, ax)
-            ax.sync_y_with_y = types.MethodType(sync_y_with_y, ax)
-            ax.sync_y_with_z = types.MethodType(sync_y_with_z, ax)
-
-        axis3D.sync_z_with_x = types.MethodType(sync_z_with_x, axis3D)
-        axis3D.sync_z_with_y = types.MethodType(sync_z_with_y, axis3D)
-        axis3D.sync_z_with_z = types.MethodType(sync_z_with_z, axis3D)
-
-        # Connect XY subplot
-        axisXY.callbacks.connect('xlim_changed', axisXZ.sync_x_with_x)
-        axisXY.callbacks.connect('xlim_changed', axis3D.sync_x_with_x)
-        axisXY.callbacks.connect('ylim_changed', axisYZ.sync_x_with_y)
-        axisXY.callbacks.connect('ylim_changed', axis3D.sync_y_with_y)
-
-        # Connect XZ subplot
-        axisXZ.callbacks.connect('xlim_changed', axisXY.sync_x_with_x)
-        axisXZ.callbacks.connect('xlim_changed', axis3D.sync_x_with_x)
-        axisXZ.callbacks.connect('ylim_changed', axisYZ.sync_y_with_y)
-        axisXZ.callbacks.connect('ylim_changed', axis3D.sync_z_with_y)
-
-        # Connect YZ subplot
-        axisYZ.callbacks.connect('xlim_changed', axisXY.sync_y_with_x)
-        axisYZ.callbacks.connect('xlim_changed', axis3D.sync_y_with_x)
-        axisYZ.callbacks.connect('ylim_changed', axisXZ.sync_y_with_y)
-        axisYZ.callbacks.connect('ylim_changed', axis3D.sync_z_with_y)
-
-        # Connect 3D subplot
-        axis3D.callbacks.connect('xlim_changed', axisXY.sync_x_with_x)
-        axis3D.callbacks.connect('xlim_changed', axisXZ.sync_x_with_x)
-        axis3D.callbacks.connect('ylim_changed', axisXY.sync_y_with_y)
-        axis3D.callbacks.connect('ylim_changed', axisYZ.sync_x_with_y)
-        axis3D.callbacks.connect('zlim_changed', axisXZ.sync_y_with_z)
-        axis3D.callbacks.connect('zlim_changed', axisYZ.sync_y_with_z)
-
-        # invert the x axis in the YX subplot
-        axisYZ.invert_xaxis()
-
-        # set labels for 3D plot
-        axis3D.set_xlabel('X axis')
-        axis3D.set_ylabel('Y axis')
-        axis3D.set_zlabel('Z axis')
-
-        self._fig = fig
-        self._axisXZ = axisXZ
-        self._axisYZ = axisYZ
-        self._axisXY = axisXY
-        self._axis3D = axis3D
-
-    def plot(self, x, y, z, kwargsXZ=None, kwargsYZ=None, kwargsXY=None,
-             kwargs3D=None, kwargsShared=None):
-        '''
-        Plot a scatter.
-
-        Args:
-            x, y, z (1D array). Positions of data points.
-
-            kwargsXZ, kwargsYZ, kwargsXY, kwargs3D (dictionary). Extra keyword
-                arguments to be passed to the single plotting functions.
-                Internally :func:`~mpl_toolkits.mplot3d.art3d.Axes3D.scatter`
-                is used for the 3D plot and standard
-                :func:`~matplotlib.axes.Axes.plot` for 2D plots.
-
-            kwargsShared (dictionary). Extra keyword arguments common to all plots.
-                Arguments specified via specific kwargs will always have the
-                precedence and won't be overwritten.
-
-        '''
-        kwargsXZ = _merge_dicts(kwargsShared, kwargsXZ)
-        kwargsYZ = _merge_dicts(kwargsShared, kwargsYZ)
-        kwargsXY = _merge_dicts(kwargsShared, kwargsXY)
-        kwargs3D = _merge_dicts(kwargsShared, kwargs3D)
-
-        self._plot2DGraphs(x, y, z, kwargsXZ, kwargsYZ, kwargsXY)
-        if kwargs3D is None:
-            self._axis3D.plot(x, y, z)
-        else:
-            self._axis3D.plot(x, y, z, **kwargs3D)
-
-    def scatter(self, x, y, z, kwargsXZ=None, kwargsYZ=None, kwargsXY=None,
-                kwargs3D=None, kwargsShared=None):
-        '''
-        Plot a scatter.
-
-        Args:
-            x, y, z (1D array). Positions of data points.
-
-            kwargsXZ, kwargsYZ, kwargsXY, kwargs3D (dictionary). Extra keyword
-                arguments to be passed to the single plotting functions.
-                Internally :func:`~mpl_toolkits.mplot3d.art3d.Axes3D.scatter`
-                is used for the 3D plot and standard
-                :func:`~matplotlib.axes.Axes.scatter` for 2D plots.
-
-            kwargsShared (dictionary). Extra keyword arguments common to all plots.
-                Arguments specified via specific kwargs will always have the
-                precedence and won't be overwritten.
-        '''
-
-        kwargsXZ = _merge_dicts(kwargsShared, kwargsXZ)
-        kwargsYZ = _merge_dicts(kwargsShared, kwargsYZ)
-        kwargsXY = _merge_dicts(kwargsShared, kwargsXY)
-        kwargs3D = _merge_dicts(kwargsShared, kwargs3D)
-
-        self._scatter2DGraphs(x, y, z, kwargsXZ, kwargsYZ, kwargsXY)
-        if kwargs3D is None:
-            self._axis3D.scatter(x, y, z)
-        else:
-            self._axis3D.scatter(x, y, z, **kwargs3D)
-
-    def plot_trisurf(self, x, y, z, kwargsXZ=None, kwargsYZ=None, kwargsXY=None,
-                     kwargs3D=None, kwargsShared=None):
-        '''
-        Plot a trisurf
-        '''
-        raise NotImplementedError("plot_trisurf: Not Implemented Yet")
-
-    def plot_surface(self, X, Y, Z, kwargsXZ=None, kwargsYZ=None, kwargsXY=None,
-                     kwargs3D=None, kwargsShared=None):
-        '''
-        Plot a surface.
-
-        Args:
-            X, Y, Z (2D array). Data values as 2D arrays.
-
-            kwargsXZ, kwargsYZ, kwargsXY, kwargs3D (dictionary). Extra keyword
-                arguments to be passed to the single plotting functions.
-                Internally :func:`~mpl_toolkits.mplot3d.art3d.Axes3D.plot_surface`
-                is used for the 3D plot and standard :func:`~matplotlib.axes.Axes.plot`
-                for 2D plots.
-
-            kwargsShared (dictionary). Extra keyword arguments common to all plots.
-                Arguments specified via specific kwargs will always have the
-                precedence and won't be overwritten.
-        '''
-
-        kwargsXZ = _merge_dicts(kwargsShared, kwargsXZ)
-        kwargsYZ = _merge_dicts(kwargsShared, kwargsYZ)
-        kwargsXY = _merge_dicts(kwargsShared, kwargsXY)
-        kwargs3D = _merge_dicts(kwargsShared, kwargs3D)
-
-        self._plot2DGraphs(X, Y, Z, kwargsXZ, kwargsYZ, kwargsXY)
-        self._plot2DGraphs(X.T, Y.T, Z.T, kwargsXZ, kwargsYZ, kwargsXY)
-        if kwargs3D is None:
-            self._axis3D.plot_surface(X, Y, Z)
-        else:
-            self._axis3D.plot_surface(X, Y, Z, **kwargs3D)
-
-    def plot_wireframe(self, X, Y, Z, kwargsXZ=None, kwargsYZ=None, kwargsXY=None,
-                       kwargs3D=None, kwargsShared=None):
-        '''
-        Plot a wireframe.
-
-        Args:
-            X, Y, Z (2D array). Data values as 2D arrays.
-
-            kwargsXZ, kwargsYZ, kwargsXY, kwargs3D (dictionary). Extra keyword
-                arguments to be passed to the single plotting functions.
-                Internally :func:`~mpl_toolkits.mplot3d.art3d.Axes3D.plot_wireframe`
-                is used for the 3D plot and standard :func:`~matplotlib.axes.Axes.plot`
-                for 2D plots.
-
-            kwargsShared (dictionary). Extra keyword arguments common to all plots.
-                Arguments specified via specific kwargs will always have the
-                precedence and won't be overwritten.
-        '''
-
-        kwargsXZ = _merge_dicts(kwargsShared, kwargsXZ)
-        kwargsYZ = _merge_dicts(kwargsShared, kwargsYZ)
-        kwargsXY = _merge_dicts(kwargsShared, kwargsXY)
-        kwargs3D = _merge_dicts(kwargsShared, kwargs3D)
-
-        self._plot2DGraphs(X, Y, Z, kwargsXZ, kwargsYZ, kwargsXY)
-        self._plot2DGraphs(X.T, Y.T, Z.T, kwargsXZ, kwargsYZ, kwargsXY)
-        if kwargs3D is None:
-            self._axis3D.plot_wireframe(X, Y, Z)
-        else:
-            self._axis3D.plot_wireframe(X, Y, Z, **kwargs3D)
-
-    def plot_collection(self, x, y, z, kwargsXZ=None, kwargsYZ=None, kwargsXY=None,
-                        kwargs3D=None, kwargsShared=None):
-        '''
-        Plot a collection.
-
-        Args:
-            x, y, z (1D array). Arrays containing the vertices of the collection object.
-                Internally :func:`~mpl_toolkits.mplot3d.art3d.Poly3DCollection`
-                and :func:`~matplotlib.collections.PolyCollection` are used
-                to create the collections.
-
-            kwargsXZ, kwargsYZ, kwargsXY, kwargs3D (dictionary).
-                Extra keyword arguments to be passed to the single plotting
-                functions. Internally :func:`add_collection3d` and
-                :func:`add_collection` are called.
-
-            kwargsShared (dictionary). Extra keyword arguments common to all plots.
-                Arguments specified via specific kwargs will always have the
-                precedence and won't be overwritten.
-        '''
-        kwargsXZ = _merge_dicts(kwargsShared, kwargsXZ)
-        kwargsYZ = _merge_dicts(kwargsShared, kwargsYZ)
-        kwargsXY = _merge_dicts(kwargsShared, kwargsXY)
-        kwargs3D = _merge_dicts(kwargsShared, kwargs3D)
-
-        self._collection2DGraphs(x, y, z, kwargsXZ, kwargsYZ, kwargsXY)
-        verts = [list(zip(x, y, z))]
-        if kwargs3D is None:
-            self._axis3D.add_collection3d(Poly3DCollection(verts))
-        else:
-            self._axis3D.add_collection3d(Poly3DCollection(verts, **kwargs3D))
-
-    def show(self, block=False):
-        """
-        Display the figure.
-
-        Args:
-            block (bool). If True the computation is blocked waiting for
-                user's input. Default: False
-        """
-        self._fig.show()
-        if block:
-            input("Press any key to continue")
-
-    # ###############
-    # Private Methods
-    # ###############
-
-    def _plot2DGraphs(self, x, y, z, kwargsXZ=None, kwargsYZ=None, kwargsXY=None):
-        """
-        Function that plot data on the 2D axis as a simple plot
-        """
-        if kwargsXZ is None:
-            self._axisXZ.plot(x, z)
-        else:
-            self._axisXZ.plot(x, z, **kwargsXZ)
-
-        if kwargsYZ is None:
-            self._axisYZ.plot(y, z)
-        else:
-            self._axisYZ.plot(y, z, **kwargsYZ)
-
-        if kwargsXY is None:
-            self._axisXY.plot(x, y)
-        else:
-            self._axisXY.plot(x, y, **kwargsXY)
-
-    def _scatter2DGraphs(self, x, y, z, kwargsXZ=None, kwargsYZ=None, kwargsXY=None):
-        """
-        Function that plot data on the 2D axis as a scatter plot
-        """
-        if kwargsXZ is None:
-            self._axisXZ.scatter(x, z)
-        else:
-            self._axisXZ.scatter(x, z, **kwargsXZ)
-
-        if kwargsYZ is None:
-            self._axisYZ.scatter(y, z)
-        else:
-            self._axisYZ.scatter(y, z, **kwargsYZ)
-
-        if kwargsXY is None:
-            self._axisXY.scatter(x, y)
-        else:
-            self._axisXY.scatter(x, y, **kwargsXY)
-
-    def _collection2DGraphs(self, x, y, z, kwargsXZ=None, kwargsYZ=None, kwargsXY=None):
-        """
-        Function that plot data on the 2D axis as collections
-        """
-
-        vertxy = [list(zip(x, y))]
-        vertxz = [list(zip(x, z))]
-        vertyz = [list(zip(y, z))]
-
-        if kwargsXY is None:
-            self._axisXY.add_collection(PolyCollection(vertxy))
-        else:
-            self._axisXY.add_collection(PolyCollection(vertxy, **kwargsXY))
-        if kwargsXZ is None:
-            self._axisXZ.add_collection(PolyCollection(vertxz))
-        else:
-            self._axisXZ.add_collection(PolyCollection(vertxz, **kwargsXZ))
-        if kwargsYZ is None:
-            self._axisYZ.add_collection(PolyCollection(vertyz))
-        else:
-            self._axisYZ.add_collection(PolyCollection(vertyz, **kwargsYZ))
+# Copyright (c) 2016 Alessandro Pietro Bardelli
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Module containing OrthoProj, a class which can create an Orthogonal Projection
+of 3D data with full axes synchronisation.
+"""
+# pylint: disable=invalid-name
+import functools
+import multiprocessing
+import os
+import time
+import warnings
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from io import BytesIO
+import numpy as np
+import matplotlib
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from mpl_toolkits.mplot3d.art3d import Line3D, Poly3DCollection
+from matplotlib.collections import Collection, PolyCollection, LineCollection, PathCollection
+from matplotlib.image import AxesImage
+from matplotlib.patches import PathPatch
+from matplotlib.lines import Line2D
+from matplotlib.path import Path
+from matplotlib.tri import Triangulation
+from matplotlib.colors import to_rgba_array
+from matplotlib.transforms import Bbox, IdentityTransform
+
+# Number of points per bucket of the finest level of the min/max pyramids of
+# the level-of-detail lines
+_PYRAMID_LEAF = 64
+
+# (coordinate, sign) of the minimum of u, maximum of u, minimum of v and
+# maximum of v kept for each bucket of a min/max pyramid, after which come
+# its first and last point (a maximum is the minimum of the opposite)
+_PYRAMID_EXTREMA = ((0, 1.), (0, -1.), (1, 1.), (1, -1.))
+
+# Maximum number of points drawn in the 3D view by a density scatter
+_DENSITY_3D_POINTS = 100000
+
+# Number of points read at once from memory-mapped arrays
+_CHUNK_POINTS = 1 << 20
+
+# Pixels on the longest side of the grid used to compute silhouettes
+_SILHOUETTE_PIXELS = 1024
+
+# Triangles smaller than this number of half pixels are not drawn to compute
+# silhouettes, but sampled
+_SAMPLED_LEVELS = 8
+
+# Number of bytes of a volume read at once
+_CHUNK_BYTES = 1 << 26
+
+# Maximum number of cells per side of the projections of a volume drawn in
+# the 3D view
+_VOLUME_3D_CELLS = 64
+
+# Number of interactions (draws following limit changes) whose callbacks are
+# kept by instrumented OrthoProj objects
+_STATS_INTERACTIONS = 100
+
+# Average number of points per cell, and maximum number of cells per side,
+# of the grids indexing the datasets for the linked selection
+_INDEX_CELL_POINTS = 4
+_INDEX_MAX_SIDE = 2048
+
+# Default style of the markers highlighting the selected point
+_HIGHLIGHT_KWARGS = {'marker': 'o', 'markersize': 12, 'markerfacecolor': 'none',
+                     'markeredgecolor': 'r', 'markeredgewidth': 2, 'linestyle': 'none'}
+
+# Projection matrices of the XZ, YZ and XY views of each layout, whose rows
+# are the directions of the horizontal and vertical axis of the plots, and
+# cells of the 2x2 grid holding each view and the 3D view. In first-angle
+# projection the left view is right of the front view and the top view below
+# it, in third-angle projection the right view is right of the front view and
+# the top view above it.
+_LAYOUTS = {
+    'first-angle': ({'XZ': [[1, 0, 0], [0, 0, 1]], 'YZ': [[0, -1, 0], [0, 0, 1]],
+                     'XY': [[1, 0, 0], [0, 1, 0]]},
+                    {'XZ': 0, 'YZ': 1, 'XY': 2, '3D': 3}),
+    'third-angle': ({'XZ': [[1, 0, 0], [0, 0, 1]], 'YZ': [[0, 1, 0], [0, 0, 1]],
+                     'XY': [[1, 0, 0], [0, 1, 0]]},
+                    {'XY': 0, '3D': 1, 'XZ': 2, 'YZ': 3})}
+
+# The datasets are drawn without copying their points by writing private
+# attributes of the lines and collections, known for these versions of
+# matplotlib only: with the other versions the artists are given copies
+_SHARE_DATA = (3, 6) <= tuple(matplotlib.__version_info__[:2]) < (3, 12)
+
+# Keyword arguments of collections holding colors
+_COLOR_KWARGS = ('color', 'colors', 'facecolor', 'facecolors', 'fc',
+                 'edgecolor', 'edgecolors', 'ec')
+
+# Keyword arguments of scatters that can hold a size, width or transparency
+# per point
+_POINT_KWARGS = ('s', 'linewidth', 'linewidths', 'lw', 'alpha')
+
+# Other keyword arguments of collections that can hold a value per face
+_FACE_KWARGS = ('array', 'linewidth', 'linewidths', 'lw', 'antialiased', 'antialiaseds',
+                'aa', 'urls')
+
+# Keyword arguments of collections holding line styles: a list holds one
+# per face, while a tuple is a single (offset, dashes) style
+_LINESTYLE_KWARGS = ('linestyle', 'linestyles', 'ls', 'dashes')
+
+
+def _merge_dicts(*dict_args):
+    '''
+    Given any number of dicts, shallow copy and merge into a new dict,
+    precedence goes to key value pairs in latter dicts.
+    '''
+    result = {}
+    for dictionary in dict_args:
+        if dictionary is not None:
+            result.update(dictionary)
+    return result
+
+
+def _filled(values):
+    '''
+    Return values as a float array where the masked entries of masked arrays
+    are NaN, so that they are neither drawn nor autoscaled. Unmasked arrays
+    of floats are not copied.
+    '''
+    return np.ma.filled(np.ma.asarray(values, dtype=float), np.nan)
+
+
+def _reorderFaces(kwargs, order):
+    '''
+    Return a copy of the collection kwargs where all per-face properties
+    (i.e. the ones having an element per face) follow the given order.
+    Any other keyword argument is passed as it is.
+    '''
+    result = {}
+    for key, value in kwargs.items():
+        if key in _COLOR_KWARGS and not isinstance(value, str):
+            colors = to_rgba_array(value)
+            if len(colors) == len(order):
+                value = colors[order]
+        elif key in _FACE_KWARGS and np.ndim(value) == 1 and len(value) == len(order):
+            value = np.asarray(value)[order]
+        elif key in _LINESTYLE_KWARGS and isinstance(value, list) and \
+                len(value) == len(order):
+            value = [value[i] for i in order]
+        result[key] = value
+    return result
+
+
+def _dataInterval(axis, axisCoord):
+    '''
+    Return the (min, max) interval of the data of the given axis coordinate.
+    '''
+    if axisCoord == 'z':
+        return axis.zz_dataLim.intervalx
+    dataLim = getattr(axis, 'xy_dataLim', axis.dataLim)
+    return getattr(dataLim, 'interval' + axisCoord)
+
+
+def _pixelWidth(axis):
+    '''
+    Return the width in pixels of the given axis (at least 1).
+    '''
+    return max(int(axis.get_window_extent().width), 1)
+
+
+def _dataArtists(axis):
+    '''
+    Return the artists added to the given axis by the plotting calls.
+    '''
+    return [artist for artists in [axis.lines, axis.collections, axis.images,
+                                   axis.patches, axis.texts, axis.artists]
+            for artist in artists]
+
+
+def _elementCount(artist, limit):
+    '''
+    Return the number of elements (vertices or markers) drawn by a data
+    artist, or any number above limit once it is known to exceed it. The
+    artists of the 3D axis are counted on their 3D data, since they are
+    projected only when drawn. Images count as no element.
+    '''
+    if hasattr(artist, 'get_data_3d'):
+        return len(artist.get_data_3d()[0])
+    if isinstance(artist, Line2D):
+        return len(artist.get_xydata())
+    offsets3D = getattr(artist, '_offsets3d', None)
+    if offsets3D is not None:
+        return np.size(offsets3D[0])
+    for name in ('_faces', '_segments3d'):
+        data = getattr(artist, name, None)
+        if isinstance(data, np.ndarray):
+            return data.size // 3
+        if data is not None and len(data) <= limit:
+            return sum(len(item) for item in data)
+        if data is not None:
+            return len(data)
+    if not hasattr(artist, 'get_paths'):
+        return 0
+    paths = artist.get_paths()
+    count = max(len(artist.get_offsets()), len(paths))
+    if len(paths) > limit:
+        return count
+    return max(count, sum(len(path.vertices) for path in paths))
+
+
+def _minmaxDecimate(chunks, coords, start, stop, nbins):
+    '''
+    Return the points of the :class:`_Chunks` (or :class:`_ProjectedChunks`)
+    with index in [start, stop) to keep in order to draw the given
+    coordinates with about nbins buckets.
+    For each bucket the points where any of the coordinates reaches its
+    minimum or maximum are kept, so that the envelope of the data is
+    preserved. The chunks are read one at a time.
+    '''
+    count = stop - start
+    if count <= 2 * len(coords) * nbins:
+        return np.concatenate([np.empty((0, chunks.width))] + [
+            chunk[max(start - first, 0):stop - first] for first, chunk in
+            chunks.range(start, stop)])
+
+    size = -(-count // nbins)
+    buckets = -(-count // size)
+    # lowest value found so far in each bucket, for each coordinate and sign
+    # (the maximum is the lowest value of the opposite), with its index and point
+    signs = [(coord, sign) for coord in coords for sign in (1., -1.)]
+    best = np.full((len(signs), buckets), np.inf)
+    index = np.full((len(signs), buckets), -1)
+    kept = np.empty((len(signs), buckets, chunks.width))
+    ends = np.empty((2, chunks.width))
+
+    for first, chunk in chunks.range(start, stop):
+        low, high = max(start - first, 0), min(stop - first, len(chunk))
+        part = chunk[low:high]
+        offset = first + low
+        if offset == start:
+            ends[0] = part[0]
+        if offset + len(part) == stop:
+            ends[1] = part[-1]
+
+        # the chunk holds the end of a bucket, some full buckets and the
+        # beginning of another one
+        head = min(-(offset - start) % size, len(part))
+        full = (len(part) - head) // size
+        pieces = [np.arange(head, head + full * size, size)]
+        if head:
+            pieces.insert(0, [0])
+        if head + full * size < len(part):
+            pieces.append([head + full * size])
+        pieces = np.concatenate(pieces).astype(np.intp)
+        target = (offset - start + pieces) // size
+        for k, (coord, sign) in enumerate(signs):
+            values = sign * part[:, coord]
+            hits = [head + np.arange(0, full * size, size) +
+                    values[head:head + full * size].reshape(full, size).argmin(axis=1)]
+            if head:
+                hits.insert(0, [values[:head].argmin()])
+            if head + full * size < len(part):
+                hits.append([head + full * size + values[head + full * size:].argmin()])
+            hits = np.concatenate(hits).astype(np.intp)
+            better = values[hits] < best[k, target]
+            best[k, target[better]] = values[hits[better]]
+            index[k, target[better]] = offset + hits[better]
+            kept[k, target[better]] = part[hits[better]]
+
+    found = index >= 0
+    _, unique = np.unique(np.concatenate(([start, stop - 1], index[found])),
+                          return_index=True)
+    return np.concatenate((ends, kept[found]))[unique]
+
+
+def _subsample(chunks, count):
+    '''
+    Return one every step points of the :class:`_Chunks`, with the step
+    chosen to return at most count points, and the step.
+    '''
+    step = max(-(-len(chunks) // count), 1)
+    return np.concatenate([np.empty((0, 3))] + [
+        chunk[-first % step::step] for first, chunk in chunks]), step
+
+
+def _edgePath(vertices, edges):
+    '''
+    Return the (E, 2) edges between the (N, 2) vertices as a single (3E, 2)
+    array of segments separated by NaNs, drawn as one path.
+    '''
+    path = np.full((len(edges), 3, 2), np.nan)
+    path[:, :2] = vertices[edges]
+    return path.reshape(-1, 2)
+
+
+def _gridTriangles(X, Y, Z):
+    '''
+    Return the (2F, 3, 3) array of the triangles splitting the F cells of
+    the surface defined by the 2D arrays X, Y, Z.
+    '''
+    grid = np.stack((X, Y, Z), axis=-1).astype(float)
+    corners = [grid[:-1, :-1], grid[:-1, 1:], grid[1:, 1:], grid[1:, :-1]]
+    return np.concatenate((np.stack(corners[:3], axis=-2).reshape(-1, 3, 3),
+                           np.stack(corners[2:] + corners[:1], axis=-2).reshape(-1, 3, 3)))
+
+
+def _rasterize(polygons, xlim, ylim, shape):
+    '''
+    Return the boolean mask of the pixels of a grid of the given (rows,
+    columns) shape spanning xlim, ylim that are covered by the (F, V, 2)
+    polygons. The polygons thinner than a pixel are also stroked, so that
+    the ones seen edge-on are not lost.
+    '''
+    rows, columns = shape
+    polygons = (polygons - [xlim[0], ylim[0]]) * [columns / (xlim[1] - xlim[0]),
+                                                  rows / (ylim[1] - ylim[0])]
+    mask = np.zeros(shape, dtype=bool)
+
+    # triangles up to a few pixels are marked through a grid of points spaced
+    # by half a pixel at most, so that every pixel whose center they cover
+    # holds one of them: much faster than drawing them
+    if polygons.shape[1] == 3:
+        # elementwise over the corners: much faster than reducing the small axes
+        a, b, c = polygons[:, 0], polygons[:, 1], polygons[:, 2]
+        size = np.maximum(np.maximum(a, b), c) - np.minimum(np.minimum(a, b), c)
+        levels = np.ceil(2 * np.maximum(size[:, 0], size[:, 1]))
+        levels = np.maximum(levels, 1).astype(int)
+        sampled = levels <= _SAMPLED_LEVELS
+        for level in np.unique(levels[sampled]):
+            i, j = np.mgrid[0:level + 1, 0:level + 1]
+            i, j = i[i + j <= level], j[i + j <= level]
+            weights = np.column_stack((i, j, level - i - j))[:, :, np.newaxis] / float(level)
+            weights = weights.astype(np.float32)
+            selected = polygons[levels == level].astype(np.float32)
+            step = _CHUNK_POINTS // len(weights)
+            for start in range(0, len(selected), step):
+                corners = selected[start:start + step, np.newaxis]
+                samples = (weights[:, 0] * corners[:, :, 0] + weights[:, 1] * corners[:, :, 1] +
+                           weights[:, 2] * corners[:, :, 2])
+                samples = samples.reshape(-1, 2).astype(np.intp)
+                mask[np.clip(samples[:, 1], 0, rows - 1),
+                     np.clip(samples[:, 0], 0, columns - 1)] = True
+        polygons = polygons[~sampled]
+        if not len(polygons):
+            return mask
+
+    x, y = polygons[..., 0], polygons[..., 1]
+    area = (x * np.roll(y, -1, axis=1) - np.roll(x, -1, axis=1) * y).sum(axis=1) / 2
+    perimeter = np.hypot(*(np.roll(polygons, -1, axis=1) - polygons).T).sum(axis=0)
+    thin = 2 * np.abs(area) < perimeter
+
+    # orient all the polygons counterclockwise: drawn as a single path with
+    # the nonzero rule their union is then filled, even where they overlap
+    polygons = np.where((area < 0)[:, np.newaxis, np.newaxis], polygons[:, ::-1], polygons)
+
+    # draw straight in pixel coordinates: an axis would compute the limits
+    # of the paths, segment by segment
+    fig = Figure(figsize=(columns / 72., rows / 72.), dpi=72)
+    canvas = FigureCanvasAgg(fig)
+    for selected, facecolor, edgecolor in [(polygons, 'k', 'none'),
+                                           (polygons[thin], 'none', 'k')]:
+        if len(selected):
+            fig.add_artist(PathPatch(_polygonsPath(selected), facecolor=facecolor,
+                                     edgecolor=edgecolor, linewidth=1, antialiased=False,
+                                     transform=IdentityTransform()))
+    canvas.draw()
+    pixels = np.asarray(canvas.buffer_rgba())[::-1, :, 0] < 128
+    mask[:pixels.shape[0], :pixels.shape[1]] |= pixels[:rows, :columns]
+    return mask
+
+
+def _polygonsPath(polygons):
+    '''
+    Return a single path made of the closed (F, V, 2) polygons.
+    '''
+    vertices = np.concatenate((polygons, polygons[:, :1]), axis=1).reshape(-1, 2)
+    codes = np.full(polygons.shape[:2], Path.LINETO, dtype=Path.code_type)
+    codes[:, 0] = Path.MOVETO
+    codes = np.column_stack((codes, np.full(len(polygons), Path.CLOSEPOLY,
+                                            dtype=Path.code_type))).ravel()
+    path = Path(vertices, codes)
+    path.should_simplify = False
+    return path
+
+
+def _silhouette(polygons, filled, resolution=_SILHOUETTE_PIXELS):
+    '''
+    Return the closed lines outlining the union of the (F, V, 2) polygons
+    or, if filled, the paths of the region they cover (with its holes).
+
+    The polygons are rasterized on a grid with resolution pixels on its
+    longest side and the border of the covered pixels is traced, so that
+    the result is made of a handful of paths whatever the number of polygons.
+    '''
+    # contourpy is a dependency of matplotlib since 3.6
+    import contourpy
+
+    polygons = np.asarray(polygons, dtype=float)
+    polygons = polygons[np.isfinite(polygons.reshape(len(polygons), -1).sum(axis=1))]
+    if not len(polygons):
+        return []
+    low = np.array([polygons[..., 0].min(), polygons[..., 1].min()])
+    high = np.array([polygons[..., 0].max(), polygons[..., 1].max()])
+    pixel = (high - low).max() / resolution or 1.
+    # leave an empty border of two pixels, wider than the stroke of the thin
+    # polygons, so that the traced outline is always closed
+    columns, rows = (np.ceil((high - low) / pixel) + 5).astype(int)
+    xlim = (low[0] - 2 * pixel, low[0] + (columns - 2) * pixel)
+    ylim = (low[1] - 2 * pixel, low[1] + (rows - 2) * pixel)
+    mask = _rasterize(polygons, xlim, ylim, (rows, columns))
+    rows, columns = mask.shape
+
+    generator = contourpy.contour_generator(
+        xlim[0] + (np.arange(columns) + .5) * (xlim[1] - xlim[0]) / columns,
+        ylim[0] + (np.arange(rows) + .5) * (ylim[1] - ylim[0]) / rows,
+        mask.astype(float), line_type='Separate', fill_type='OuterCode')
+    if filled:
+        return [Path(points, codes) for points, codes in zip(*generator.filled(.5, 1.5))]
+    return [Path(points) for points in generator.lines(.5)]
+
+
+def _histogram2D(u, v, umin, umax, vmin, vmax, nu, nv, counts=None):
+    '''
+    Bin the points u, v in a regular (nv, nu) grid spanning the given range.
+    Points outside the range (or not finite) are ignored. If counts is given
+    the points are accumulated in it, otherwise a new grid is returned.
+    '''
+    if counts is None:
+        counts = np.zeros((nv, nu), dtype=np.intp)
+    u = np.asarray(u, dtype=float)
+    v = np.asarray(v, dtype=float)
+    inside = (u >= umin) & (u <= umax) & (v >= vmin) & (v <= vmax)
+    iu = ((u[inside] - umin) * (nu / ((umax - umin) or 1.))).astype(np.intp)
+    iv = ((v[inside] - vmin) * (nv / ((vmax - vmin) or 1.))).astype(np.intp)
+    np.minimum(iu, nu - 1, out=iu)
+    np.minimum(iv, nv - 1, out=iv)
+    counts += np.bincount(iv * nu + iu, minlength=nu * nv).reshape(nv, nu)
+    return counts
+
+
+def _projectVolume(volume, reduce, workers=None, size=_CHUNK_BYTES):
+    '''
+    Return the reductions ("max", "mean" or "sum") of the (nx, ny, nz)
+    volume along the Y, X and Z axis, i.e., the (nz, nx), (nz, ny) and
+    (ny, nx) images of the XZ, YZ and XY planes.
+
+    The volume is read in slabs of about size bytes along its axis with the
+    largest stride (the X planes of a C ordered volume, the Z planes of a
+    transposed one), so that every slab is a contiguous block of memory and
+    memory-mapped volumes are never loaded at once. The slabs are reduced
+    concurrently by workers threads (default: the number of CPUs).
+    '''
+    ufunc = np.fmax if reduce == "max" else np.add
+    dtype = volume.dtype if reduce == "max" else float
+    axis = int(np.argmax(np.abs(volume.strides)))
+    first, second = [other for other in range(3) if other != axis]
+    slabbed = np.moveaxis(volume, axis, 0)
+    n, nFirst, nSecond = slabbed.shape
+    step = max(size // (nFirst * nSecond * volume.dtype.itemsize), 1)
+    starts = list(range(0, n, step))
+    workers = max(min(workers or os.cpu_count() or 1, len(starts)), 1)
+    # rows of the reductions along the first and second other axis
+    alongFirst = np.empty((n, nSecond), dtype=dtype)
+    alongSecond = np.empty((n, nFirst), dtype=dtype)
+
+    def work(index):
+        # every thread reduces one slab out of workers, writing its rows of
+        # two images and accumulating its own reduction along the slab axis
+        plane = None
+        for start in starts[index::workers]:
+            slab = slabbed[start:start + step]
+            alongFirst[start:start + step] = ufunc.reduce(slab, axis=1, dtype=dtype)
+            alongSecond[start:start + step] = ufunc.reduce(slab, axis=2, dtype=dtype)
+            partial = ufunc.reduce(slab, axis=0, dtype=dtype)
+            plane = partial if plane is None else ufunc(plane, partial, out=plane)
+        return plane
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        partials = list(executor.map(work, range(workers)))
+    plane = partials[0]
+    for partial in partials[1:]:
+        ufunc(plane, partial, out=plane)
+
+    # the reduction along each axis, indexed by the two others in order
+    images = [None] * 3
+    images[axis] = plane
+    images[first] = alongFirst if axis < second else alongFirst.T
+    images[second] = alongSecond if axis < first else alongSecond.T
+    if reduce == "mean":
+        for reduced, image in enumerate(images):
+            image /= volume.shape[reduced]
+    return images[1].T, images[0].T, images[2].T
+
+
+def _coarsen(image, cells, reduce):
+    '''
+    Return the image reduced by blocks to cells rows and columns at most
+    (keeping the maximum of each block if reduce is "max", the mean
+    otherwise) and the edges of the blocks, as fractions of the rows and
+    of the columns of the image.
+    '''
+    edges = []
+    for axis in (0, 1):
+        n = image.shape[axis]
+        starts = np.arange(0, n, -(-n // cells))
+        if reduce == "max":
+            image = np.fmax.reduceat(image, starts, axis=axis)
+        else:
+            counts = np.diff(np.append(starts, n))
+            image = (np.add.reduceat(image, starts, axis=axis, dtype=float) /
+                     np.expand_dims(counts, 1 - axis))
+        edges.append(np.append(starts, n) / float(n))
+    return image, edges[0], edges[1]
+
+
+class _Chunks():
+    '''
+    Source of (N, 3) points read one chunk at a time, so that the reductions
+    computed on data that does not fit in memory only hold a chunk at once.
+
+    The source can be an (N, 3) array, e.g. a :class:`numpy.memmap`, read in
+    slices of size points, an iterable of (n, 3) arrays that can be iterated
+    more than once, or a function returning a new iterator of (n, 3) arrays
+    at every call.
+    '''
+    width = 3
+
+    def __init__(self, source, size=_CHUNK_POINTS):
+        if isinstance(source, np.ndarray):
+            if source.ndim != 2 or source.shape[1] != 3:
+                raise ValueError("points must be an (N, 3) array")
+        elif not callable(source) and iter(source) is source:
+            raise ValueError("an iterator of chunks can be read only once: "
+                             "pass an iterable or a function returning it")
+        self.source = source
+        self.size = size
+        self._len = len(source) if isinstance(source, np.ndarray) else None
+
+    def __len__(self):
+        if self._len is None:
+            self._len = sum(len(chunk) for _, chunk in self)
+        return self._len
+
+    def __iter__(self):
+        '''
+        Yield the index of the first point of each chunk and the chunk, as an
+        (n, 3) float array.
+        '''
+        return self.range(0, None)
+
+    def range(self, start, stop):
+        '''
+        Yield the index of the first point and the points of the chunks
+        holding the points with index in [start, stop) (all the points
+        after start if stop is None).
+        '''
+        if isinstance(self.source, np.ndarray):
+            first = start - start % self.size
+            chunks = (self.source[i:i + self.size]
+                      for i in range(first, len(self.source), self.size))
+        else:
+            first = 0
+            chunks = self.source() if callable(self.source) else self.source
+        for chunk in chunks:
+            if stop is not None and first >= stop:
+                return
+            chunk = _filled(chunk).reshape(-1, 3)
+            if first + len(chunk) > start:
+                yield first, chunk
+            first += len(chunk)
+        self._len = first
+
+    def bounds(self):
+        '''
+        Return the minimum and the maximum of each coordinate, ignoring NaNs
+        (NaN if there is no point).
+        '''
+        low, high = np.full(3, np.nan), np.full(3, np.nan)
+        for _, chunk in self:
+            if len(chunk):
+                # reducing each column is faster than reducing along axis 0
+                low = np.fmin(low, [np.fmin.reduce(chunk[:, i]) for i in range(3)])
+                high = np.fmax(high, [np.fmax.reduce(chunk[:, i]) for i in range(3)])
+        return low, high
+
+    def array(self):
+        '''
+        Return all the points as an (N, 3) float array. Arrays (and memory
+        maps) of floats are not copied.
+        '''
+        if isinstance(self.source, np.ndarray):
+            return _filled(self.source)
+        return np.concatenate([np.empty((0, 3))] + [chunk for _, chunk in self])
+
+
+class _ProjectedChunks():
+    '''
+    Points of a :class:`_Chunks` projected on a 2D view, read and projected
+    one chunk at a time as (n, 2) arrays.
+    '''
+    width = 2
+
+    def __init__(self, chunks, view):
+        self.chunks = chunks
+        self.view = view
+
+    def __len__(self):
+        return len(self.chunks)
+
+    def __iter__(self):
+        return self.range(0, None)
+
+    def range(self, start, stop):
+        '''
+        Yield the index of the first point and the projected points of the
+        chunks holding the points with index in [start, stop).
+        '''
+        for first, chunk in self.chunks.range(start, stop):
+            yield first, self.view.project(chunk)
+
+
+def _viewMatrix(view):
+    '''
+    Return the (2, 3) projection matrix of an auxiliary view, given either
+    as the matrix itself or as the direction pointing from the data to the
+    viewer, in which case the vertical axis of the view is the projection of
+    the Z axis (of the Y axis for a view along Z).
+    '''
+    view = np.array(view, dtype=float)
+    if view.shape == (3,):
+        norm = np.linalg.norm(view)
+        if not norm:
+            raise ValueError("OrthoProj: the direction of a view cannot be null")
+        direction = view / norm
+        up = [0., 1., 0.] if abs(direction[2]) > 1 - 1e-9 else [0., 0., 1.]
+        right = np.cross(up, direction)
+        right /= np.linalg.norm(right)
+        view = np.array([right, np.cross(direction, right)])
+    elif view.shape != (2, 3):
+        raise ValueError("OrthoProj: a view must be a direction or a (2, 3) matrix")
+    if not np.linalg.norm(np.cross(view[0], view[1])) > 0:
+        raise ValueError("OrthoProj: the rows of a view matrix must not be parallel")
+    # snap to the coordinate axis the rows that are along them up to rounding
+    view[np.abs(view) < 1e-12] = 0.
+    for row in view:
+        if np.count_nonzero(row) == 1 and abs(abs(row.sum()) - 1) < 1e-12:
+            row[:] = np.sign(row)
+    return view
+
+
+class _View():
+    '''
+    2D axis showing the projection of the points on a plane, described by a
+    (2, 3) matrix whose rows are the directions of its horizontal and
+    vertical axis.
+
+    A row along a coordinate axis (an aligned row) plots that coordinate
+    and its axis is synchronised with all the others showing it, inverted if
+    the row points to the negative side. When both rows are aligned the
+    projection of (..., 3) points is a view of them (e.g. points[..., ::2]),
+    otherwise it is a matrix product.
+    '''
+
+    def __init__(self, name, axis, matrix):
+        self.name = name
+        self.axis = axis
+        matrix = np.asarray(matrix, dtype=float)
+        # direction from the data to the viewer
+        self.direction = np.cross(matrix[0], matrix[1])
+        self.direction /= np.linalg.norm(self.direction)
+        self.coords = [int(np.flatnonzero(row)[0]) if np.count_nonzero(row) == 1 and
+                       abs(row.sum()) == 1 else None for row in matrix]
+        self.inverted = [coord is not None and row.sum() < 0
+                         for coord, row in zip(self.coords, matrix)]
+        # inverted axis are drawn with the positive coordinate
+        self.matrix = np.where(np.array(self.inverted)[:, np.newaxis], -matrix, matrix)
+        self.columns = None
+        if None not in self.coords:
+            first, last = self.coords
+            step = last - first
+            stop = last + (1 if step > 0 else -1)
+            self.columns = slice(first, stop if stop >= 0 else None, step)
+
+    def project(self, points):
+        '''
+        Return the (..., 2) projection of (..., 3) points on the view.
+        '''
+        if self.columns is not None:
+            return points[..., self.columns]
+        return np.dot(points, self.matrix.T)
+
+    def interval(self, low, high):
+        '''
+        Return the (min, max) corners of the projection on the view of the
+        box between the corners low and high.
+        '''
+        low, high = self.matrix * low, self.matrix * high
+        return np.minimum(low, high).sum(axis=1), np.maximum(low, high).sum(axis=1)
+
+
+class _Projector():
+    '''
+    Projection of (..., 3) points on all the 2D views of an
+    :class:`OrthoProj` at once: the views aligned with the coordinate axis
+    get a view of the points, without copying them, while the other views
+    get a view of the result of a single matrix product, computing all of
+    them in one pass over the points.
+    '''
+
+    def __init__(self, views):
+        self.views = views
+        self.oblique = [view for view in views if view.columns is None]
+        self.matrix = None
+        if self.oblique:
+            self.matrix = np.concatenate([view.matrix for view in self.oblique]).T
+
+    def project(self, points):
+        '''
+        Return the list of the (..., 2) projections of (..., 3) points on
+        each view.
+        '''
+        projected = None
+        if self.matrix is not None:
+            projected = np.dot(points, self.matrix)
+        result = []
+        for view in self.views:
+            if view.columns is not None:
+                result.append(points[..., view.columns])
+            else:
+                k = 2 * self.oblique.index(view)
+                result.append(projected[..., k:k + 2])
+        return result
+
+
+class _GridIndex():
+    '''
+    Uniform grid over (N, 2) points (e.g. the projection of a dataset on a
+    view), finding the points near a position by visiting only the cells
+    around it.
+
+    The indices of the points are sorted by cell, so that the points of each
+    cell are a slice of them: building it takes a single sort (of the cells
+    packed with the indices, much faster than an argsort) and a query is
+    independent of the number of points.
+    '''
+
+    def __init__(self, points):
+        self.points = points
+        n = len(points)
+        u, v = points[:, 0], points[:, 1]
+        finite = np.isfinite(u) & np.isfinite(v)
+        count = int(np.count_nonzero(finite))
+        self.side = min(max(int(np.sqrt(count / _INDEX_CELL_POINTS)), 1), _INDEX_MAX_SIDE)
+        if count:
+            self.low = np.array([np.min(u, where=finite, initial=np.inf),
+                                 np.min(v, where=finite, initial=np.inf)])
+            high = np.array([np.max(u, where=finite, initial=-np.inf),
+                             np.max(v, where=finite, initial=-np.inf)])
+        else:
+            self.low, high = np.zeros(2), np.ones(2)
+        self.scale = self.side / np.where(high > self.low, high - self.low, 1.)
+
+        # the points that are not finite go in an extra cell, never visited
+        keys = np.empty(n, dtype=np.int64)
+        for start in range(0, n, _CHUNK_POINTS):
+            stop = min(start + _CHUNK_POINTS, n)
+            cells = self.cell(u[start:stop], 0) + self.side * self.cell(v[start:stop], 1)
+            cells[~finite[start:stop]] = self.side * self.side
+            keys[start:stop] = (cells << 32) | np.arange(start, stop)
+        keys.sort()
+        self.order = (keys & 0xffffffff).astype(np.int32 if n < 2 ** 31 else np.intp)
+        self.starts = np.concatenate(([0], np.cumsum(
+            np.bincount(keys >> 32, minlength=self.side * self.side + 1))))
+
+    def cell(self, values, coord):
+        '''
+        Return the (clipped) cell of the values along coord (0 or 1).
+        '''
+        with np.errstate(invalid='ignore'):
+            cells = ((np.asarray(values, dtype=float) - self.low[coord]) *
+                     self.scale[coord]).astype(np.int64)
+        return np.clip(cells, 0, self.side - 1)
+
+    def candidates(self, umin, umax, vmin, vmax):
+        '''
+        Return the indices of the points in the cells overlapping the given
+        rectangle.
+        '''
+        i0, i1 = self.cell([umin, umax], 0)
+        j0, j1 = self.cell([vmin, vmax], 1)
+        return np.concatenate([self.order[self.starts[j * self.side + i0]:
+                                          self.starts[j * self.side + i1 + 1]]
+                               for j in range(j0, j1 + 1)])
+
+    def nearest(self, transform, x, y, radius):
+        '''
+        Return the index of the point nearest to the display position x, y
+        and its distance in pixels, or None if there is no point within
+        radius pixels. transform maps the coordinates of the points to
+        display coordinates.
+        '''
+        corners = transform.inverted().transform([[x - radius, y - radius],
+                                                  [x + radius, y + radius]])
+        (umin, umax), (vmin, vmax) = np.sort(corners, axis=0).T
+        candidates = self.candidates(umin, umax, vmin, vmax)
+        if not len(candidates):
+            return None
+        candidates.sort()
+        projected = transform.transform(self.points[candidates])
+        distances = np.hypot(projected[:, 0] - x, projected[:, 1] - y)
+        best = np.nanargmin(distances) if np.isfinite(distances).any() else 0
+        if not distances[best] <= radius:
+            return None
+        return int(candidates[best]), float(distances[best])
+
+
+class _MinMaxPyramid():
+    '''
+    Min/max pyramid of the :class:`_ProjectedChunks` of a line, built once
+    reading the points one chunk at a time.
+
+    Every level splits the points in buckets of consecutive points (leaf
+    points in the finest one, twice as many in each coarser one) and holds,
+    for each bucket, the points where u and v reach their minimum and
+    maximum, i.e., both its bounding box and its min/max decimation, and its
+    first and last point. The visible span and the decimation of a view are
+    answered from the level matching the pixel width of the axis, so that
+    their cost does not depend on the number of points.
+    '''
+
+    def __init__(self, points, leaf=_PYRAMID_LEAF):
+        self.points = points
+        self.leaf = leaf
+        self.count = 0
+        extrema, indexes = [np.empty((0, 6, 2))], [np.empty((0, 6), dtype=np.intp)]
+        rest = np.empty((0, 2))
+        for first, chunk in points:
+            # the buckets span the chunks: the points after the last full
+            # bucket of a chunk are reduced with the next one
+            if len(rest):
+                first -= len(rest)
+                chunk = np.concatenate((rest, chunk))
+            full = len(chunk) // leaf * leaf
+            bucketExtrema, bucketIndexes = self._reduce(chunk[:full].reshape(-1, leaf, 2), first)
+            extrema.append(bucketExtrema)
+            indexes.append(bucketIndexes)
+            rest = chunk[full:]
+            self.count = first + len(chunk)
+        if len(rest):
+            # the last bucket is completed with copies of the last point
+            padded = np.concatenate((rest, np.repeat(rest[-1:], leaf - len(rest), axis=0)))
+            bucketExtrema, bucketIndexes = self._reduce(padded[np.newaxis], self.count - len(rest))
+            extrema.append(bucketExtrema)
+            indexes.append(np.minimum(bucketIndexes, self.count - 1))
+        self.levels = [(np.concatenate(extrema), np.concatenate(indexes))]
+        while len(self.levels[-1][0]) > 1:
+            self.levels.append(self._merge(*self.levels[-1]))
+
+    def interval(self):
+        '''
+        Return the (min, max) corners of the bounding box of the line (NaN if
+        there is no valid point), read on the coarsest level.
+        '''
+        extrema = self.levels[-1][0]
+        if not len(extrema):
+            return np.full(2, np.nan), np.full(2, np.nan)
+        return (np.array([np.fmin.reduce(extrema[:, 0, 0]), np.fmin.reduce(extrema[:, 2, 1])]),
+                np.array([np.fmax.reduce(extrema[:, 1, 0]), np.fmax.reduce(extrema[:, 3, 1])]))
+
+    def decimate(self, box, nbins):
+        '''
+        Return the points to keep to draw with about nbins buckets the part
+        of the line in box, given as (umin, umax, vmin, vmax), extended by one
+        bucket on each side so that segments crossing the border are still
+        drawn. The whole line is decimated if no point is in box.
+        '''
+        span = self._span(box, nbins)
+        if span is None:
+            span = self._span((-np.inf, np.inf, -np.inf, np.inf), nbins)
+            if span is None:
+                return np.empty((0, 2))
+        level, start, stop = span
+        extrema, indexes = self.levels[level]
+        start, stop = max(start - 1, 0), min(stop + 1, len(extrema))
+        if stop - start < nbins:
+            # zoomed in beyond the finest level: decimate the points themselves
+            return _minmaxDecimate(self.points, [0, 1], start * self.leaf,
+                                   min(stop * self.leaf, self.count), nbins)
+
+        kept = np.concatenate((extrema[start, 4:5], extrema[start:stop, :4].reshape(-1, 2),
+                               extrema[stop - 1, 5:]))
+        _, unique = np.unique(np.concatenate((indexes[start, 4:5], indexes[start:stop, :4].ravel(),
+                                              indexes[stop - 1, 5:])),
+                              return_index=True)
+        return kept[unique]
+
+    def _span(self, box, nbins):
+        '''
+        Return the level and the range [start, stop) of its buckets from the
+        first to the last one whose bounding box meets box, going down from
+        the coarsest level to the first one where the range holds nbins
+        buckets (or the finest). Return None if no bounding box meets box.
+        '''
+        umin, umax, vmin, vmax = box
+        start, stop = 0, 1
+        for level in range(len(self.levels) - 1, -1, -1):
+            extrema = self.levels[level][0]
+            if level < len(self.levels) - 1:
+                # the buckets meeting box are below the ones of the level above
+                start, stop = 2 * start, min(2 * stop, len(extrema))
+            part = extrema[start:stop]
+            # comparisons with NaN (buckets with no valid point) are False
+            meets = ((part[:, 1, 0] >= umin) & (part[:, 0, 0] <= umax) &
+                     (part[:, 3, 1] >= vmin) & (part[:, 2, 1] <= vmax))
+            if not meets.any():
+                return None
+            start, stop = start + meets.argmax(), start + len(meets) - meets[::-1].argmax()
+            if stop - start >= nbins:
+                return level, start, stop
+        return 0, start, stop
+
+    def _reduce(self, block, first):
+        '''
+        Return the (n, 6, 2) extrema and the (n, 6) indexes of the buckets of
+        an (n, leaf, 2) block of points, the first one starting at index first.
+        '''
+        hits = np.empty((len(block), 6), dtype=np.intp)
+        for k, (coord, sign) in enumerate(_PYRAMID_EXTREMA):
+            values = sign * block[:, :, coord]
+            values[np.isnan(values)] = np.inf
+            hits[:, k] = values.argmin(axis=1)
+        hits[:, 4] = 0
+        hits[:, 5] = self.leaf - 1
+        rows = np.arange(len(block))[:, np.newaxis]
+        return block[rows, hits], first + rows * self.leaf + hits
+
+    @staticmethod
+    def _merge(extrema, indexes):
+        '''
+        Return the extrema and the indexes of the level above the given one,
+        merging its buckets two by two.
+        '''
+        if len(extrema) % 2:
+            # merging the last bucket with itself leaves it unchanged
+            extrema = np.concatenate((extrema, extrema[-1:]))
+            indexes = np.concatenate((indexes, indexes[-1:]))
+        extrema = extrema.reshape(-1, 2, 6, 2)
+        indexes = indexes.reshape(-1, 2, 6)
+        choice = np.empty((len(extrema), 6), dtype=np.intp)
+        for k, (coord, sign) in enumerate(_PYRAMID_EXTREMA):
+            values = sign * extrema[:, :, k, coord]
+            values[np.isnan(values)] = np.inf
+            choice[:, k] = values.argmin(axis=1)
+        choice[:, 4] = 0
+        choice[:, 5] = 1
+        rows, entries = np.arange(len(extrema))[:, np.newaxis], np.arange(6)
+        return extrema[rows, choice, entries], indexes[rows, choice, entries]
+
+
+class _LODLine():
+    '''
+    Full resolution data of a line drawn on a 2D axis with level-of-detail,
+    as the :class:`_ProjectedChunks` of its points on the axis and their
+    :class:`_MinMaxPyramid`. The artist only holds a min/max decimated
+    version of the visible range.
+    '''
+
+    def __init__(self, axis, points):
+        self.axis = axis
+        self.points = None
+        self.line = None
+        self._pyramid = None
+        self._view = None
+        self.set_points(points)
+
+    def set_points(self, points):
+        '''
+        Set the :class:`_ProjectedChunks` of the line, building their pyramid,
+        and force the next refresh to recompute the decimated data.
+        '''
+        self.points = points
+        self._pyramid = _MinMaxPyramid(points)
+        self._view = None
+
+    def invalidate(self):
+        '''
+        Force the next refresh to recompute the decimated data.
+        '''
+        self._view = None
+
+    def interval(self):
+        '''
+        Return the (min, max) corners of the bounding box of the whole line.
+        '''
+        return self._pyramid.interval()
+
+    def decimated(self, umin=-np.inf, umax=np.inf, vmin=-np.inf, vmax=np.inf):
+        '''
+        Return u, v of the part of the line in the given box (all of it if no
+        point is in it) decimated to the pixel width of the axis.
+        '''
+        kept = self._pyramid.decimate((umin, umax, vmin, vmax), _pixelWidth(self.axis))
+        return kept[:, 0], kept[:, 1]
+
+    def refresh(self):
+        '''
+        Recompute the decimated data for the current view of the axis.
+        Nothing is done if neither the limits nor the size of the axis changed.
+        '''
+        umin, umax = sorted(self.axis.get_xlim())
+        vmin, vmax = sorted(self.axis.get_ylim())
+        view = (umin, umax, vmin, vmax, _pixelWidth(self.axis))
+        if view == self._view:
+            return
+        self._view = view
+        self.line.set_data(*self.decimated(umin, umax, vmin, vmax))
+
+
+class _DensityImage(AxesImage):
+    '''
+    Image showing the density of the :class:`_ProjectedChunks` of points on
+    a 2D axis. The points are binned on the visible range only, with one bin
+    per pixel, reading them one chunk at a time, when the image is drawn after
+    the view changed. Unless a norm, vmin or vmax is given the colour scale is
+    fitted to the counts of every new binning. The (min, max) corners of the
+    bounding box of all the points are kept in interval.
+    '''
+
+    def __init__(self, axis, points, **kwargs):
+        AxesImage.__init__(self, axis, origin='lower', interpolation='nearest')
+        self._fixedNorm = any(key in kwargs for key in ('norm', 'vmin', 'vmax'))
+        vmin, vmax = kwargs.pop('vmin', None), kwargs.pop('vmax', None)
+        self.update(dict((key, value) for key, value in kwargs.items()
+                         if hasattr(self, 'set_' + key)))
+        if vmin is not None or vmax is not None:
+            self.set_clim(vmin, vmax)
+        self.points = points
+        self.interval = None
+        self._view = None
+        self._binsExtent = None
+
+    def get_extent(self):
+        return self._binsExtent
+
+    @contextmanager
+    def dataExtent(self):
+        '''
+        Context manager making :func:`get_extent` return the bounding box of
+        all the points (given by interval) instead of the binned range, for
+        the data limits to be recomputed.
+        '''
+        binsExtent = self._binsExtent
+        (umin, vmin), (umax, vmax) = self.interval
+        self._binsExtent = (umin, umax, vmin, vmax)
+        try:
+            yield
+        finally:
+            self._binsExtent = binsExtent
+
+    def invalidate(self):
+        '''
+        Force the next refresh to recompute the histogram.
+        '''
+        self._view = None
+
+    def draw(self, renderer):
+        # an interaction changes the limits several times (e.g. x then y of a
+        # zoom, on all the axis sharing them): bin the points once, when drawn
+        self.refresh()
+        AxesImage.draw(self, renderer)
+
+    def refresh(self):
+        '''
+        Recompute the histogram for the current view of the axis. Nothing is
+        done if neither the limits nor the size of the axis changed.
+        '''
+        umin, umax = sorted(self.axes.get_xlim())
+        vmin, vmax = sorted(self.axes.get_ylim())
+        bbox = self.axes.get_window_extent()
+        nu, nv = max(int(bbox.width), 1), max(int(bbox.height), 1)
+        view = (umin, umax, vmin, vmax, nu, nv)
+        if view == self._view:
+            return
+        self._view = view
+
+        counts = np.zeros((nv, nu), dtype=np.intp)
+        for _, chunk in self.points:
+            _histogram2D(chunk[:, 0], chunk[:, 1], umin, umax, vmin, vmax, nu, nv, counts)
+        self._binsExtent = (umin, umax, vmin, vmax)
+        self.set_data(np.ma.masked_equal(counts, 0))
+        if not self._fixedNorm:
+            # the counts of a zoomed view are much lower than the full view
+            self.norm.vmin = self.norm.vmax = None
+            self.autoscale_None()
+
+
+class _PointBuffer():
+    '''
+    Contiguous (N, 3) float buffer holding the points of a dataset.
+    Without a window the buffer grows as needed. With a window it is a ring
+    buffer holding the last window points: each point is stored twice, at
+    i and i + window, so that the last points are always a contiguous view.
+    The points can also be left in a :class:`_Chunks` source, that is only
+    read in the buffer when points are appended.
+    '''
+
+    def __init__(self, window=None):
+        if window is not None and window < 1:
+            raise ValueError("window must be a positive integer")
+        self.window = window
+        self._data = np.empty((0 if window is None else 2 * window, 3))
+        self._count = 0
+        self._source = None
+
+    def wrap(self, source):
+        '''
+        Replace the stored points with the ones of a :class:`_Chunks`,
+        without reading them.
+        '''
+        self.clear()
+        self._source = source
+
+    def view(self):
+        '''
+        Return an (N, 3) view of the stored points, oldest first.
+        '''
+        if self._source is not None:
+            return self._source.array()
+        if self.window is None:
+            return self._data[:self._count]
+        size = min(self._count, self.window)
+        start = (self._count - size) % self.window
+        return self._data[start:start + size]
+
+    def chunks(self):
+        '''
+        Return a :class:`_Chunks` reading the stored points.
+        '''
+        if self._source is not None:
+            return self._source
+        return _Chunks(self.view())
+
+    def clear(self):
+        '''
+        Remove all the stored points.
+        '''
+        self._count = 0
+        self._source = None
+
+    def extend(self, points):
+        '''
+        Append an (N, 3) array of points.
+        '''
+        if self._source is not None:
+            source = self._source
+            self.clear()
+            self.extend(source.array())
+        points = _filled(points).reshape(-1, 3)
+        if self.window is None:
+            count = self._count + len(points)
+            if count > len(self._data):
+                grown = np.empty((max(count, 2 * len(self._data)), 3))
+                grown[:self._count] = self._data[:self._count]
+                self._data = grown
+            self._data[self._count:count] = points
+            self._count = count
+        else:
+            skipped = max(len(points) - self.window, 0)
+            positions = (self._count + skipped + np.arange(len(points) - skipped)) % self.window
+            self._data[positions] = points[skipped:]
+            self._data[positions + self.window] = points[skipped:]
+            self._count += len(points)
+
+
+def _pointBuffer(x, y, z, window, stream):
+    '''
+    Return the :class:`_PointBuffer` holding the data points given to a
+    plotting call, either as x, y, z arrays or as a single source of (N, 3)
+    points in x. When there is no window, (N, 3) float arrays are used
+    without copying them and, if stream is True, the points of any other
+    source are not read in memory.
+    '''
+    points = _PointBuffer(window)
+    if y is None and z is None:
+        source = _Chunks(x)
+        inPlace = isinstance(x, np.ndarray) and x.dtype == float and not np.ma.isMaskedArray(x)
+        if window is None and (stream or inPlace):
+            points.wrap(source)
+        else:
+            points.extend(source.array())
+    elif y is None or z is None:
+        raise ValueError("y and z must be either both given or both omitted")
+    else:
+        points.extend(np.column_stack([_filled(v).ravel() for v in (x, y, z)]))
+    return points
+
+
+def _shareOffsets(collection, view):
+    '''
+    Make a collection read its offsets from an (N, 2) view of the points of
+    a dataset, instead of its own copy of them (unless _SHARE_DATA is False).
+    '''
+    if _SHARE_DATA:
+        collection._offsets = view  # pylint: disable=protected-access
+        collection.stale = True
+    else:
+        collection.set_offsets(view)
+
+
+def _shareOffsets3D(collection, points):
+    '''
+    Make a 3D collection read its offsets from the (N, 3) points of a dataset,
+    instead of its own copy of them (unless _SHARE_DATA is False).
+    '''
+    if _SHARE_DATA:
+        collection._offsets3d = tuple(points.T)  # pylint: disable=protected-access
+        collection.stale = True
+    else:
+        collection.set_offsets(points[:, :2])
+        collection.set_3d_properties(points[:, 2], 'z')
+
+
+def _pointKwargs(kwargs, count):
+    '''
+    Return the keyword arguments of a scatter of count points giving a value
+    per point, as a dictionary mapping the name of the property to set (e.g.
+    'array' for the values of c mapped to colours, 'sizes' for s) to the
+    values.
+    '''
+    result = {}
+    if kwargs is None or count < 2:
+        return result
+    for key, value in kwargs.items():
+        if key == 'c' and np.ndim(value) == 1 and np.asarray(value).dtype.kind in 'biuf':
+            if len(value) == count:
+                result['array'] = value
+        elif key == 'c' or key in _COLOR_KWARGS:
+            try:
+                colors = to_rgba_array(value)
+            except ValueError:
+                # e.g. edgecolors='face'
+                continue
+            if len(colors) == count:
+                result['facecolor' if key == 'c' else key] = colors
+        elif key in _POINT_KWARGS and np.ndim(value) == 1 and len(value) == count:
+            result['sizes' if key == 's' else key] = value
+    return result
+
+
+def _resizePointKwargs(collection, kwargs, count):
+    '''
+    Set the properties of a collection given a value per point by
+    :func:`_pointKwargs` for count points: the values are cut, or repeated
+    cyclically as matplotlib does when drawing 2D collections.
+    '''
+    collection.set(**dict((key, np.resize(value, (count,) + np.shape(value)[1:]))
+                          for key, value in kwargs.items()))
+
+
+class _SharedLine(Line2D):
+    '''
+    Line drawing an (N, 2) view of the (N, 3) points of a dataset, e.g. its
+    x and z columns, without copying it: the points are stored only once for
+    all the axis and changes made in place are shown on the next draw.
+    If _SHARE_DATA is False it is a plain line drawing a copy of the view.
+    '''
+
+    def __init__(self, view, **kwargs):
+        self._view = None
+        self._columns = None
+        self._shared = _SHARE_DATA
+        Line2D.__init__(self, [], [], **kwargs)
+        self.set_view(view)
+
+    def set_view(self, view):
+        '''
+        Set the (N, 2) float array of the points drawn by the line.
+        '''
+        if not self._shared:
+            Line2D.set_data(self, view[:, 0], view[:, 1])
+            return
+        self._view = view
+        self._columns = self._xorig, self._yorig = view[:, 0], view[:, 1]
+        self._invalidx = self._invalidy = True
+        self.stale = True
+
+    def set_data(self, *args):
+        if not self._shared:
+            Line2D.set_data(self, *args)
+            return
+        if len(args) == 1:
+            (x, y), = args
+        else:
+            x, y = args
+        self.set_view(np.column_stack((x, y)).astype(float))
+
+    def recache(self, always=False):
+        if not self._shared:
+            Line2D.recache(self, always)
+            return
+        if self._xorig is not self._columns[0] or self._yorig is not self._columns[1]:
+            # set_xdata or set_ydata replaced a column: draw a new view of both
+            self.set_view(np.column_stack((self._xorig, self._yorig)).astype(float))
+        if self._drawstyle != 'default':
+            # steps are drawn from a new array anyway
+            Line2D.recache(self, always=True)
+            return
+        self._xy = self._view
+        self._x, self._y = self._xorig, self._yorig
+        self._subslice = False
+        self._path = Path(self._view)
+        self._transformed_path = None
+        self._invalidx = self._invalidy = False
+
+
+class DataHandle():
+    '''
+    Handle to the artists drawn on all the axis of an :class:`OrthoProj` by a
+    single plotting call, that allows to update their data in place.
+    Instances are returned by :func:`OrthoProj.plot` and
+    :func:`OrthoProj.scatter`.
+    '''
+
+    def __init__(self, proj, points, artists, update, autoscale=False):
+        self._proj = proj
+        self._points = points
+        self._artists = artists
+        self._update = update
+        self._autoscale = autoscale
+        self._indexes = {}
+        self._view = None
+
+    @property
+    def artists(self):
+        '''
+        List of the matplotlib artists showing the data.
+        '''
+        return list(self._artists)
+
+    @property
+    def data(self):
+        '''
+        (N, 3) array of the points currently shown. Except for level-of-detail
+        and density plots, it is the array drawn by all the axis: call
+        :func:`refresh` after changing it in place.
+        '''
+        return self._points.view()
+
+    def refresh(self):
+        '''
+        Redraw the artists after the points in :attr:`data` were changed in
+        place. Except for level-of-detail and density plots, the ranges of
+        the coordinates shown by autoscaling axis are fitted to the new data.
+        '''
+        self._changed()
+        if self._autoscale:
+            self._proj._autoscaleData()  # pylint: disable=protected-access
+        self._proj._redraw(self._artists)  # pylint: disable=protected-access
+
+    def _changed(self):
+        '''
+        Update the artists after the points changed, without redrawing them.
+        '''
+        self._indexes = {}
+        self._view = None
+        self._update(self._points.view())
+        self._proj._dataChanged(self)  # pylint: disable=protected-access
+
+    def _replace(self, points):
+        '''
+        Replace the points with an (N, 3) array without redrawing the artists.
+        '''
+        self._points.clear()
+        self._points.extend(points)
+        self._changed()
+
+    def _points3D(self):
+        '''
+        Return the (N, 3) array of :attr:`data`, read only once until the data
+        changes (points streamed from an iterable are read again by every
+        call to :attr:`data`).
+        '''
+        if self._view is None:
+            self._view = self._points.view()
+        return self._view
+
+    def _index(self, view):
+        '''
+        Return the :class:`_GridIndex` of the projection of the points on the
+        given :class:`_View`, built on first use.
+        '''
+        if view not in self._indexes:
+            self._indexes[view] = _GridIndex(view.project(self._points3D()))
+        return self._indexes[view]
+
+    def set_data(self, x, y, z):
+        '''
+        Replace the data shown by the artists.
+
+        Args:
+            x, y, z (1D array). Positions of the new data points. With a
+                window only the last window points are kept.
+        '''
+        self._points.clear()
+        self.append(x, y, z)
+
+    def append(self, x, y, z):
+        '''
+        Append points to the data shown by the artists.
+
+        Args:
+            x, y, z (scalar or 1D array). Positions of the data points to
+                append. With a window the oldest points are dropped.
+        '''
+        self._points.extend(np.column_stack(np.broadcast_arrays(
+            *[np.atleast_1d(_filled(v)) for v in (x, y, z)])))
+        self.refresh()
+
+
+class LimitSync():
+    '''
+    Shared X, Y and Z ranges of the axis of an :class:`OrthoProj`.
+
+    Every axis showing a coordinate is kept in sync with the others: a limit
+    change on any of them is propagated in a single pass to all the axis
+    showing the same coordinate (preserving their orientation), then the
+    listeners are notified once and a single redraw is requested. The axis
+    showing other directions are set, in the same pass, to the projection
+    of the X, Y, Z box on their direction.
+    '''
+
+    def __init__(self, fig, views, stats=None, projected=None):
+        '''
+        Args:
+            fig (:class:`~matplotlib.figure.Figure`). The synchronised figure.
+
+            views (dictionary). Map each coordinate ('x', 'y' or 'z') to the
+                list of (axis, axis coordinate) showing it.
+
+            stats (_Stats). Recorder of the limit change callbacks and of the
+                duration of the synchronisation passes, set by instrumented
+                :class:`OrthoProj` objects. Default: None
+
+            projected (list). The (axis, axis coordinate, direction) showing
+                the projection of the points on a direction that is not a
+                coordinate axis (given as an (x, y, z) vector). Their limits
+                follow the ranges, their own changes are not propagated.
+                Default: None
+        '''
+        self._fig = fig
+        self._views = views
+        self._projected = list(projected or [])
+        self._stats = stats
+        self._ranges = {}
+        self._pending = set()
+        self._sources = {}
+        self._held = 0
+        self._syncing = False
+        self._listeners = []
+        for coord, axes in views.items():
+            axis, axisCoord = axes[0]
+            self._ranges[coord] = tuple(sorted(self._getLim(axis, axisCoord)))
+            for axis, axisCoord in axes:
+                axis.callbacks.connect('%slim_changed' % axisCoord,
+                                       self._callback(coord, axisCoord))
+
+    @property
+    def x(self):
+        '''
+        (min, max) range of the X coordinate.
+        '''
+        return self._ranges['x']
+
+    @property
+    def y(self):
+        '''
+        (min, max) range of the Y coordinate.
+        '''
+        return self._ranges['y']
+
+    @property
+    def z(self):
+        '''
+        (min, max) range of the Z coordinate.
+        '''
+        return self._ranges['z']
+
+    def set(self, x=None, y=None, z=None):
+        '''
+        Set the range of one or more coordinates on all the axis at once.
+
+        Args:
+            x, y, z (tuple). The new (min, max) ranges. Default: None, i.e.,
+                unchanged
+        '''
+        with self.hold():
+            for coord, lim in (('x', x), ('y', y), ('z', z)):
+                if lim is not None:
+                    self._ranges[coord] = tuple(sorted(lim))
+                    self._pending.add(coord)
+                    self._sources.pop(coord, None)
+
+    def connect(self, func):
+        '''
+        Register func to be called after every synchronisation pass with the
+        set of the coordinates whose range changed.
+        '''
+        self._listeners.append(func)
+
+    @contextmanager
+    def hold(self):
+        '''
+        Context manager collecting all the limit changes happening inside it
+        and synchronising them in a single pass on exit.
+        '''
+        self._held += 1
+        try:
+            yield self
+        finally:
+            self._held -= 1
+            if not self._held and self._pending:
+                self._sync()
+
+    def _callback(self, coord, axisCoord):
+        '''
+        Return the callback handling the limit changes of an axis coordinate
+        showing the coord coordinate.
+        '''
+        def changed(axis):
+            if self._stats is not None:
+                self._stats.callbacks += 1
+            if self._syncing:
+                return
+            self._ranges[coord] = tuple(sorted(self._getLim(axis, axisCoord)))
+            self._pending.add(coord)
+            self._sources[coord] = axis
+            if not self._held:
+                self._sync()
+        return changed
+
+    def _sync(self):
+        '''
+        Apply the pending ranges to all the axis (but the one which changed
+        it, if any), notify the listeners and request a redraw.
+        '''
+        if self._stats is not None:
+            with self._stats.timing('sync', 'pass'):
+                self._syncPass()
+        else:
+            self._syncPass()
+
+    def _syncPass(self):
+        '''
+        Body of :func:`_sync`.
+        '''
+        # apply the autoscaling requested by the plotting calls first, so that
+        # it is not cancelled by the synchronisation: reading the limits
+        # autoscales the axis and the resulting changes are synchronised too
+        self._held += 1
+        try:
+            for views in self._views.values():
+                for axis, axisCoord in views:
+                    self._getLim(axis, axisCoord)
+        finally:
+            self._held -= 1
+
+        coords, self._pending = self._pending, set()
+        sources, self._sources = self._sources, {}
+        self._syncing = True
+        try:
+            for coord in coords:
+                lim = self._ranges[coord]
+                for axis, axisCoord in self._views[coord]:
+                    if axis is sources.get(coord):
+                        continue
+                    if getattr(axis, '%saxis_inverted' % axisCoord)():
+                        self._setLim(axis, axisCoord, lim[::-1])
+                    else:
+                        self._setLim(axis, axisCoord, lim)
+            for axis, axisCoord, direction in self._projected:
+                if any(direction['xyz'.index(coord)] for coord in coords):
+                    self._setLim(axis, axisCoord, self._projectRanges(direction))
+            if self._stats is None:
+                for func in self._listeners:
+                    func(coords)
+            else:
+                with self._stats.timing('sync', 'listeners'):
+                    for func in self._listeners:
+                        func(coords)
+        finally:
+            self._syncing = False
+        # marking the figure as stale makes interactive backends request a
+        # single idle redraw (an explicit draw_idle would draw immediately on
+        # non interactive canvases)
+        self._fig.stale = True
+
+    def _projectRanges(self, direction):
+        '''
+        Return the (min, max) range of the projection of the X, Y, Z box on
+        direction.
+        '''
+        ranges = np.array([self._ranges[coord] for coord in 'xyz']).T * direction
+        return ranges.min(axis=0).sum(), ranges.max(axis=0).sum()
+
+    @staticmethod
+    def _getLim(axis, axisCoord):
+        return getattr(axis, 'get_%slim' % axisCoord)()
+
+    @staticmethod
+    def _setLim(axis, axisCoord, lim):
+        getattr(axis, 'set_%slim' % axisCoord)(lim, emit=False)
+
+
+class _Stats():
+    '''
+    Timings and counters of an instrumented :class:`OrthoProj`.
+
+    Every duration is recorded, per kind ('call', 'draw' or 'sync') and
+    name, as its count, total and last value in seconds, and passed to
+    the hook (if any) as hook(kind, name, seconds).
+    '''
+
+    def __init__(self, hook=None):
+        self.hook = hook
+        self.timings = None
+        self.callbacks = 0
+        self.interactions = None
+        self._counted = 0
+        self.reset()
+
+    def reset(self):
+        '''
+        Clear all the timings and counters.
+        '''
+        self.timings = {'call': {}, 'draw': {}, 'sync': {}}
+        self.callbacks = 0
+        self.interactions = deque(maxlen=_STATS_INTERACTIONS)
+        self._counted = 0
+
+    def record(self, kind, name, seconds):
+        '''
+        Record a duration of the given kind and name.
+        '''
+        entry = self.timings[kind].setdefault(name, {'count': 0, 'total': 0., 'last': 0.})
+        entry['count'] += 1
+        entry['total'] += seconds
+        entry['last'] = seconds
+        if self.hook is not None:
+            self.hook(kind, name, seconds)
+
+    @contextmanager
+    def timing(self, kind, name):
+        '''
+        Context manager recording the duration of its body.
+        '''
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(kind, name, time.perf_counter() - start)
+
+    def endInteraction(self):
+        '''
+        Close an interaction, i.e., the limit changes made between two draws
+        of the figure, saving the number of limit change callbacks received
+        since the previous one. Nothing is saved if there was none.
+        '''
+        if self.callbacks > self._counted:
+            self.interactions.append(self.callbacks - self._counted)
+            self._counted = self.callbacks
+
+    def timed(self, kind, name, func):
+        '''
+        Return func wrapped so that the duration of its calls is recorded.
+        '''
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with self.timing(kind, name):
+                return func(*args, **kwargs)
+        return wrapper
+
+
+# State of the worker processes saving the frames of an animation: the
+# OrthoProj, the handles, the per-frame function, the file name pattern and
+# the savefig keyword arguments, inherited from the parent process
+_frameWorker = None
+
+
+def _initFrameWorker(state):
+    '''
+    Initializer of the worker processes saving the frames of an animation.
+    '''
+    global _frameWorker  # pylint: disable=global-statement
+    _frameWorker = state
+
+
+def _saveFrame(index, frame):
+    '''
+    Save a frame of an animation from a worker process.
+    '''
+    proj, handles, func, fname, kwargs = _frameWorker
+    proj._showFrame(handles, index, frame, func)  # pylint: disable=protected-access
+    proj.savefig(fname % index, **kwargs)
+
+
+def _framePoints(data):
+    '''
+    Return the (N, 3) points of the data of a frame, given either as an
+    (x, y, z) tuple or as an (N, 3) array.
+    '''
+    if isinstance(data, tuple):
+        return np.column_stack([np.ravel(values) for values in data])
+    return np.asarray(data, dtype=float).reshape(-1, 3)
+
+
+def _timed(method):
+    '''
+    Decorator recording the duration of a plotting method when the
+    :class:`OrthoProj` is instrumented.
+    '''
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self._stats is None:  # pylint: disable=protected-access
+            return method(self, *args, **kwargs)
+        with self._stats.timing('call', method.__name__):  # pylint: disable=protected-access
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class OrthoProj():
+    """
+    Orthogonal Projection object.
+    """
+
+    _fig = None
+    _headless = False
+    _locked = None
+    _axisXZ = None
+    _axisYZ = None
+    _axisXY = None
+    _axis3D = None
+    _projector = None
+    _views = None
+    _limits = None
+    _lodArtists = None
+    _backgrounds = None
+    _stats = None
+    _datasets = None
+    _selection = None
+    _highlights = None
+    _selectionOptions = None
+    _selectionCid = None
+    _initialState = None
+
+    def __init__(self, title=None, headless=False, instrument=False, layout="first-angle",
+                 auxiliary=None):
+        """
+        Build an :class:`OrthoProj` object
+
+        Args:
+            title (string). The title string for the orthogonal projection figure.
+            Default: None, i.e., default naming
+
+            headless (bool). If True the figure is not created through pyplot
+                but is a bare :class:`~matplotlib.figure.Figure` rendered by an
+                Agg canvas, that is not registered in any global state and can
+                be used from any thread. It cannot be shown: use
+                :func:`savefig` or :func:`to_bytes` and release it with
+                :func:`close`. Default: False
+
+            instrument (bool or callable). If true, the duration of every
+                plotting call, of the draw of the figure and of each axis, and
+                of the synchronisation passes are recorded, along with the
+                number of limit change callbacks, and returned by
+                :func:`stats`. A callable is also called with the kind
+                ('call', 'draw' or 'sync'), the name and the seconds of every
+                recorded duration, e.g. to log them. Default: False
+
+            layout (string). Arrangement of the XZ (front), YZ and XY (top)
+                views: either "first-angle", with the view from the left
+                right of the front view and the top view below it, or
+                "third-angle", with the view from the right right of the
+                front view and the top view above it. Default: "first-angle"
+
+            auxiliary (list). Extra views, each one given either as the
+                direction (dx, dy, dz) pointing from the data to the viewer,
+                seen with the Z axis up (the Y axis for views along Z), or
+                as a (2, 3) matrix whose rows are the directions of the
+                horizontal and vertical axis of the view. They are added in
+                extra columns and get only kwargsShared from the plotting
+                calls (:func:`volume` is shown only on the views along the
+                coordinate axis). All the views are projected at once, with
+                a single matrix product for the ones that are not along the
+                coordinate axis. The axis of a view
+                along a coordinate axis are synchronised with the others;
+                the axis along other directions follow the projection of the
+                X, Y and Z ranges. Default: None
+
+        """
+        if layout not in _LAYOUTS:
+            raise ValueError("OrthoProj: unknown layout '%s'" % layout)
+        matrices, cells = _LAYOUTS[layout]
+        auxiliary = [_viewMatrix(view) for view in auxiliary or []]
+
+        self._lodArtists = []
+        self._datasets = []
+        self._headless = headless
+        if instrument:
+            self._stats = _Stats(instrument if callable(instrument) else None)
+
+        if headless:
+            fig = Figure()
+            FigureCanvasAgg(fig)
+            if title is not None:
+                fig.set_label(title)
+        else:
+            # pyplot selects and starts the interactive backend, which
+            # headless figures never need
+            import matplotlib.pyplot as plt
+            fig = plt.figure(title)
+        # the auxiliary views fill extra columns of a 2 rows grid
+        columns = 2 + (len(auxiliary) + 1) // 2
+
+        def cell(index):
+            return 1 + index // 2 * columns + index % 2
+
+        axisXZ = fig.add_subplot(2, columns, cell(cells['XZ']), title="Vertical Plane - XZ")
+        axisYZ = fig.add_subplot(2, columns, cell(cells['YZ']), title="Lateral Plane - YZ")
+        axisXY = fig.add_subplot(2, columns, cell(cells['XY']), title="Horizontal Plane - XY")
+        axis3D = fig.add_subplot(2, columns, cell(cells['3D']), title="3D view - XYZ",
+                                 projection="3d")
+        views = [_View('XZ', axisXZ, matrices['XZ']), _View('YZ', axisYZ, matrices['YZ']),
+                 _View('XY', axisXY, matrices['XY'])]
+        for i, matrix in enumerate(auxiliary):
+            axis = fig.add_subplot(2, columns, 3 + i % 2 * columns + i // 2,
+                                   title="Auxiliary View %d" % (i + 1))
+            views.append(_View('AUX%d' % (i + 1), axis, matrix))
+        self._projector = _Projector(views)
+
+        # Synchronise all the axis showing the same coordinate, inverting
+        # the ones along its negative side (e.g. the x axis of the YZ
+        # subplot in first-angle). The axis of the views showing other
+        # directions follow the projection of the ranges. The
+        # level-of-detail artists are refreshed after every synchronisation.
+        self._views = {'x': [], 'y': [], 'z': []}
+        projected = []
+        for view in views:
+            for axisCoord, coord, inverted, row in zip('xy', view.coords, view.inverted,
+                                                       view.matrix):
+                if coord is None:
+                    projected.append((view.axis, axisCoord, row))
+                    continue
+                if inverted:
+                    getattr(view.axis, 'invert_%saxis' % axisCoord)()
+                self._views['xyz'[coord]].append((view.axis, axisCoord))
+        for coord in 'xyz':
+            self._views[coord].append((axis3D, coord))
+        self._limits = LimitSync(fig, self._views, self._stats, projected)
+        self._limits.connect(self._updateLOD)
+
+        # Animated artists are not drawn with the rest of the figure: save
+        # the background of each axis after every draw and blit them on it
+        fig.canvas.mpl_connect('draw_event', self._onDraw)
+
+        # set labels for 3D plot
+        axis3D.set_xlabel('X axis')
+        axis3D.set_ylabel('Y axis')
+        axis3D.set_zlabel('Z axis')
+
+        self._fig = fig
+        self._axisXZ = axisXZ
+        self._axisYZ = axisYZ
+        self._axisXY = axisXY
+        self._axis3D = axis3D
+
+        # restored by reset: the plotting calls can change the margins (e.g.
+        # the 3D scatter) and the ranges
+        self._initialState = (dict((axis, axis.margins()) for _, axis in self._panes()),
+                              dict((coord, getattr(self._limits, coord)) for coord in 'xyz'))
+
+        # time the draws overriding the draw method of the instances, every
+        # draw closes the interaction that changed the limits, if any
+        if self._stats is not None:
+            fig.draw = self._stats.timed('draw', 'figure', fig.draw)
+            for name, axis in self._panes():
+                axis.draw = self._stats.timed('draw', name, axis.draw)
+            fig.canvas.mpl_connect('draw_event', lambda event: self._stats.endInteraction())
+
+    @property
+    def limits(self):
+        '''
+        The :class:`LimitSync` holding the X, Y and Z ranges shared by all
+        the axis.
+        '''
+        return self._limits
+
+    @contextmanager
+    def batch(self):
+        '''
+        Context manager to efficiently add many plots at once.
+
+        Inside it autoscaling and limit synchronisation are suspended. On exit
+        the combined data bounds of all the axis are computed once and the
+        limits of every coordinate that was autoscaling are set on all the
+        axis in a single synchronisation pass.
+
+        Example::
+
+            with proj.batch():
+                for x, y, z in series:
+                    proj.plot(x, y, z)
+        '''
+        autoscale = {}
+        for views in self._views.values():
+            for axis, axisCoord in views:
+                autoscale[axis, axisCoord] = getattr(axis, 'get_autoscale%s_on' % axisCoord)()
+                getattr(axis, 'set_autoscale%s_on' % axisCoord)(False)
+
+        try:
+            with self._limits.hold():
+                yield self
+        finally:
+            # reading the limits while autoscaling is off clears the pending
+            # autoscale requests made by the plotting calls
+            for axis, axisCoord in autoscale:
+                getattr(axis, 'get_%slim' % axisCoord)()
+            bounds = self._dataBounds()
+            self._limits.set(**dict(
+                (coord, bounds[coord]) for coord, views in self._views.items()
+                if bounds[coord] is not None and any(autoscale[view] for view in views)))
+            for (axis, axisCoord), on in autoscale.items():
+                getattr(axis, 'set_autoscale%s_on' % axisCoord)(on)
+
+    @_timed
+    def plot(self, x, y=None, z=None, kwargsXZ=None, kwargsYZ=None, kwargsXY=None,
+             kwargs3D=None, kwargsShared=None, lod=False, window=None):
+        '''
+        Plot a line.
+
+        Args:
+            x, y, z (1D array). Positions of data points. Alternatively the
+                points can be given in x alone, with y and z omitted, as an
+                (N, 3) array (e.g. a :class:`numpy.memmap`), an iterable of
+                (n, 3) chunks that can be iterated more than once, or a
+                function returning a new iterator of (n, 3) chunks.
+
+            kwargsXZ, kwargsYZ, kwargsXY, kwargs3D (dictionary). Extra keyword
+                arguments to be passed to the single plotting functions.
+                Internally :func:`~mpl_toolkits.mplot3d.art3d.Axes3D.scatter`
+                is used for the 3D plot and standard
+                :func:`~matplotlib.axes.Axes.plot` for 2D plots.
+
+            kwargsShared (dictionary). Extra keyword arguments common to all plots.
+                Arguments specified via specific kwargs will always have the
+                precedence and won't be overwritten.
+
+            lod (bool). If True the full data is stored only once and each
+                plot draws a min/max decimated version of it, sized to the
+                pixel width of the axis. The 2D plots are decimated again on
+                their visible range every time the limits change, so that
+                the drawing cost does not depend on the size of the data.
+                Points given in x alone are not read in memory but streamed
+                one chunk at a time, unless window is given. Default: False
+
+            window (int). If given, only the last window points are kept
+                (in a preallocated ring buffer) when the data is updated
+                through the returned handle, and the artists are animated:
+                updates redraw them only, blitting them on the four axes.
+                Default: None
+
+        Returns:
+            A :class:`DataHandle` that can be used to update the data in place.
+        '''
+        kwargs2D = self._kwargs2D(kwargsShared, kwargsXZ, kwargsYZ, kwargsXY)
+        kwargs3D = _merge_dicts(kwargsShared, kwargs3D)
+
+        points = _pointBuffer(x, y, z, window, stream=lod)
+
+        if lod:
+            artists, update = self._lodPlot(points.chunks(), kwargs2D, kwargs3D)
+        else:
+            data = points.view()
+            lines = self._plot2DGraphs(data, kwargs2D)
+            if kwargs3D is None:
+                line3D, = self._axis3D.plot(*data.T)
+            else:
+                line3D, = self._axis3D.plot(*data.T, **kwargs3D)
+            artists = lines + [line3D]
+
+            def update(points):
+                for line, projected in zip(lines, self._projector.project(points)):
+                    line.set_view(projected)
+                line3D.set_data_3d(*points.T)
+
+            update(data)
+
+        return self._handle(points, artists, update, window is not None, autoscale=not lod)
+
+    @_timed
+    def scatter(self, x, y=None, z=None, kwargsXZ=None, kwargsYZ=None, kwargsXY=None,
+                kwargs3D=None, kwargsShared=None, mode="points", window=None):
+        '''
+        Plot a scatter.
+
+        Args:
+            x, y, z (1D array). Positions of data points. Alternatively the
+                points can be given in x alone, with y and z omitted, as an
+                (N, 3) array (e.g. a :class:`numpy.memmap`), an iterable of
+                (n, 3) chunks that can be iterated more than once, or a
+                function returning a new iterator of (n, 3) chunks.
+
+            kwargsXZ, kwargsYZ, kwargsXY, kwargs3D (dictionary). Extra keyword
+                arguments to be passed to the single plotting functions.
+                Internally :func:`~mpl_toolkits.mplot3d.art3d.Axes3D.scatter`
+                is used for the 3D plot and standard
+                :func:`~matplotlib.axes.Axes.scatter` for 2D plots.
+
+            kwargsShared (dictionary). Extra keyword arguments common to all plots.
+                Arguments specified via specific kwargs will always have the
+                precedence and won't be overwritten.
+
+            mode (string). Either "points" or "density". With "density" the
+                2D plots show an image of the number of points per pixel,
+                binned again on the visible range every time the limits
+                change, and the 3D plot shows a subsample of the points.
+                2D kwargs that do not apply to images (e.g. marker size)
+                are ignored. Points given in x alone are not read in memory
+                but streamed one chunk at a time, unless window is given.
+                Default: "points"
+
+            window (int). If given, only the last window points are kept
+                (in a preallocated ring buffer) when the data is updated
+                through the returned handle, and the artists are animated:
+                updates redraw them only, blitting them on the four axes.
+                Default: None
+
+            Per-point properties (e.g. c or s given as sequences) follow the
+            points by index when the data is updated: they are cut when there
+            are fewer points, and repeated cyclically for the points beyond
+            the ones they were given for.
+
+        Returns:
+            A :class:`DataHandle` that can be used to update the data in place.
+        '''
+        if mode not in ("points", "density"):
+            raise ValueError("scatter: unknown mode '%s'" % mode)
+
+        kwargs2D = self._kwargs2D(kwargsShared, kwargsXZ, kwargsYZ, kwargsXY)
+        kwargs3D = _merge_dicts(kwargsShared, kwargs3D)
+
+        points = _pointBuffer(x, y, z, window, stream=mode == "density")
+
+        if mode == "density":
+            artists, update = self._densityScatter(points.chunks(), kwargs2D, kwargs3D)
+        else:
+            data = points.view()
+            scatters = self._scatter2DGraphs(data, kwargs2D)
+            if kwargs3D is None:
+                scatter3D = self._axis3D.scatter(*data.T)
+            else:
+                scatter3D = self._axis3D.scatter(*data.T, **kwargs3D)
+            artists = scatters + [scatter3D]
+
+            pointKwargs = [_pointKwargs(kwargs, len(data)) for kwargs in kwargs2D + [kwargs3D]]
+
+            def update(points):
+                for scatter, projected in zip(scatters, self._projector.project(points)):
+                    _shareOffsets(scatter, projected)
+                _shareOffsets3D(scatter3D, points)
+                for artist, kwargs in zip(artists, pointKwargs):
+                    _resizePointKwargs(artist, kwargs, len(points))
+
+            update(data)
+
+        return self._handle(points, artists, update, window is not None,
+                            autoscale=mode == "points")
+
+    @_timed
+    def plot_trisurf(self, x, y, z, triangles=None, kwargsXZ=None, kwargsYZ=None,
+                     kwargsXY=None, kwargs3D=None, kwargsShared=None, mode="wireframe"):
+        '''
+        Plot a triangulated surface.
+
+        Args:
+            x, y, z (1D array). Positions of the vertices.
+
+            triangles (2D int array). Optional (T, 3) array of indices into
+                x, y, z defining the triangles. Default: None, i.e., the
+                Delaunay triangulation of x, y
+
+            kwargsXZ, kwargsYZ, kwargsXY, kwargs3D (dictionary). Extra keyword
+                arguments to be passed to the single plotting functions.
+                Internally :func:`~mpl_toolkits.mplot3d.art3d.Axes3D.plot_trisurf`
+                is used for the 3D plot and a single
+                :func:`~matplotlib.collections.LineCollection` per 2D plot,
+                drawing every edge of the triangulation once.
+
+            kwargsShared (dictionary). Extra keyword arguments common to all plots.
+                Arguments specified via specific kwargs will always have the
+                precedence and won't be overwritten.
+
+            mode (string). What the 2D plots show: either "wireframe", the
+                edges of the triangulation, "outline", the outline of the projected
+                surface, or "filled", the region covered by it. The outline
+                is traced on a 1024 pixels grid, so that it is made of a few
+                paths whatever the size of the surface. Default: "wireframe"
+        '''
+        if mode not in ("wireframe", "outline", "filled"):
+            raise ValueError("plot_trisurf: unknown mode '%s'" % mode)
+
+        kwargs2D = self._kwargs2D(kwargsShared, kwargsXZ, kwargsYZ, kwargsXY)
+        kwargs3D = _merge_dicts(kwargsShared, kwargs3D)
+
+        triangulation = Triangulation(np.ravel(x), np.ravel(y), triangles)
+        z = np.asarray(z, dtype=float).ravel()
+        points = np.column_stack((triangulation.x, triangulation.y, z))
+        triangles = triangulation.get_masked_triangles()
+        if mode == "wireframe":
+            edges = triangulation.edges
+            for view, projected, kwargs in zip(self._projector.views,
+                                               self._projector.project(points), kwargs2D):
+                view.axis.add_collection(LineCollection([_edgePath(projected, edges)],
+                                                        **kwargs))
+                view.axis.autoscale_view()
+        else:
+            self._silhouette2DGraphs(points[triangles], mode == "filled", kwargs2D)
+        self._axis3D.plot_trisurf(triangulation, z, **kwargs3D)
+
+    @_timed
+    def plot_surface(self, X, Y, Z, kwargsXZ=None, kwargsYZ=None, kwargsXY=None,
+                     kwargs3D=None, kwargsShared=None, mode="wireframe"):
+        '''
+        Plot a surface.
+
+        Args:
+            X, Y, Z (2D array). Data values as 2D arrays.
+
+            kwargsXZ, kwargsYZ, kwargsXY, kwargs3D (dictionary). Extra keyword
+                arguments to be passed to the single plotting functions.
+                Internally :func:`~mpl_toolkits.mplot3d.art3d.Axes3D.plot_surface`
+                is used for the 3D plot and a single
+                :func:`~matplotlib.collections.LineCollection` per 2D plot.
+
+            kwargsShared (dictionary). Extra keyword arguments common to all plots.
+                Arguments specified via specific kwargs will always have the
+                precedence and won't be overwritten.
+
+            mode (string). What the 2D plots show: either "wireframe", the
+                rows and columns of the mesh, "outline", the outline of the projected
+                surface, or "filled", the region covered by it. The outline
+                is traced on a 1024 pixels grid, so that it is made of a few
+                paths whatever the size of the mesh. Default: "wireframe"
+        '''
+        if mode not in ("wireframe", "outline", "filled"):
+            raise ValueError("plot_surface: unknown mode '%s'" % mode)
+
+        kwargs2D = self._kwargs2D(kwargsShared, kwargsXZ, kwargsYZ, kwargsXY)
+        kwargs3D = _merge_dicts(kwargsShared, kwargs3D)
+
+        if mode == "wireframe":
+            self._wireframe2DGraphs(X, Y, Z, kwargs2D)
+        else:
+            self._silhouette2DGraphs(_gridTriangles(X, Y, Z), mode == "filled", kwargs2D)
+        if kwargs3D is None:
+            self._axis3D.plot_surface(X, Y, Z)
+        else:
+            self._axis3D.plot_surface(X, Y, Z, **kwargs3D)
+
+    @_timed
+    def plot_wireframe(self, X, Y, Z, kwargsXZ=None, kwargsYZ=None, kwargsXY=None,
+                       kwargs3D=None, kwargsShared=None):
+        '''
+        Plot a wireframe.
+
+        Args:
+            X, Y, Z (2D array). Data values as 2D arrays.
+
+            kwargsXZ, kwargsYZ, kwargsXY, kwargs3D (dictionary). Extra keyword
+                arguments to be passed to the single plotting functions.
+                Internally :func:`~mpl_toolkits.mplot3d.art3d.Axes3D.plot_wireframe`
+                is used for the 3D plot and a single
+                :func:`~matplotlib.collections.LineCollection` per 2D plot.
+
+            kwargsShared (dictionary). Extra keyword arguments common to all plots.
+                Arguments specified via specific kwargs will always have the
+                precedence and won't be overwritten.
+        '''
+
+        kwargs2D = self._kwargs2D(kwargsShared, kwargsXZ, kwargsYZ, kwargsXY)
+        kwargs3D = _merge_dicts(kwargsShared, kwargs3D)
+
+        self._wireframe2DGraphs(X, Y, Z, kwargs2D)
+        if kwargs3D is None:
+            self._axis3D.plot_wireframe(X, Y, Z)
+        else:
+            self._axis3D.plot_wireframe(X, Y, Z, **kwargs3D)
+
+    @_timed
+    def plot_collection(self, x, y, z, kwargsXZ=None, kwargsYZ=None, kwargsXY=None,
+                        kwargs3D=None, kwargsShared=None):
+        '''
+        Plot a collection.
+
+        Args:
+            x, y, z (1D array). Arrays containing the vertices of the collection object.
+                Internally :func:`~mpl_toolkits.mplot3d.art3d.Poly3DCollection`
+                and :func:`~matplotlib.collections.PolyCollection` are used
+                to create the collections.
+
+            kwargsXZ, kwargsYZ, kwargsXY, kwargs3D (dictionary).
+                Extra keyword arguments to be passed to the single plotting
+                functions. Internally :func:`add_collection3d` and
+                :func:`add_collection` are called.
+
+            kwargsShared (dictionary). Extra keyword arguments common to all plots.
+                Arguments specified via specific kwargs will always have the
+                precedence and won't be overwritten.
+        '''
+        kwargs2D = self._kwargs2D(kwargsShared, kwargsXZ, kwargsYZ, kwargsXY)
+        kwargs3D = _merge_dicts(kwargsShared, kwargs3D)
+
+        self._polygons(np.stack((x, y, z), axis=-1)[np.newaxis], kwargs2D, kwargs3D)
+
+    @_timed
+    def plot_collections(self, verts, faces=None, kwargsXZ=None, kwargsYZ=None,
+                         kwargsXY=None, kwargs3D=None, kwargsShared=None,
+                         depthsort=True, mode="polygons"):
+        '''
+        Plot many polygons at once, as a single collection per plot.
+
+        Args:
+            verts (array). Either an (F, V, 3) array containing the vertices of
+                F polygons with V vertices each or, when faces is given, an
+                (N, 3) array containing all the vertices of the mesh.
+                Internally :func:`~mpl_toolkits.mplot3d.art3d.Poly3DCollection`
+                and :func:`~matplotlib.collections.PolyCollection` are used
+                to create the collections.
+
+            faces (2D int array). Optional (F, V) array of indices into verts
+                defining the vertices of each polygon. Default: None
+
+            kwargsXZ, kwargsYZ, kwargsXY, kwargs3D (dictionary).
+                Extra keyword arguments to be passed to the single plotting
+                functions. Internally :func:`add_collection3d` and
+                :func:`add_collection` are called. Per-face properties (e.g.
+                facecolors) can be given as arrays of length F.
+
+            kwargsShared (dictionary). Extra keyword arguments common to all plots.
+                Arguments specified via specific kwargs will always have the
+                precedence and won't be overwritten.
+
+            depthsort (bool). If True, in each 2D plot the polygons are
+                painted from the farthest to the nearest along the viewing
+                direction of the plot, so that nearer faces hide the ones
+                behind them. Default: True
+
+            mode (string). What the 2D plots show: either "polygons", the
+                projected polygons, "outline", the outline of their union,
+                or "filled", the region covered by them. The outline is
+                traced on a 1024 pixels grid, so that it is made of a few
+                paths whatever the number of polygons. Default: "polygons"
+        '''
+        if mode not in ("polygons", "outline", "filled"):
+            raise ValueError("plot_collections: unknown mode '%s'" % mode)
+
+        kwargs2D = self._kwargs2D(kwargsShared, kwargsXZ, kwargsYZ, kwargsXY)
+        kwargs3D = _merge_dicts(kwargsShared, kwargs3D)
+
+        verts = np.asarray(verts)
+        if faces is not None:
+            verts = verts[np.asarray(faces)]
+        if mode == "polygons":
+            self._polygons(verts, kwargs2D, kwargs3D, depthsort)
+        else:
+            self._silhouette2DGraphs(verts, mode == "filled", kwargs2D)
+            self._axis3D.add_collection3d(Poly3DCollection(verts, **kwargs3D))
+
+    @_timed
+    def volume(self, V, extent=None, kwargsXZ=None, kwargsYZ=None, kwargsXY=None,
+               kwargs3D=None, kwargsShared=None, reduce="max", workers=None):
+        '''
+        Plot the projections of a volume.
+
+        Args:
+            V (3D array). The values of the voxels, indexed as V[ix, iy, iz].
+                It can be a :class:`numpy.memmap` bigger than the memory:
+                it is read one slab of planes at a time, along its axis with
+                the largest stride (to project a volume stored as
+                V[iz, iy, ix] pass V.T, which is read in Z planes).
+
+            extent (tuple). The bounds (xmin, xmax, ymin, ymax, zmin, zmax)
+                of the volume, i.e., the outer edges of its first and last
+                voxels along each axis. Default: None, i.e.,
+                (0, nx, 0, ny, 0, nz)
+
+            kwargsXZ, kwargsYZ, kwargsXY, kwargs3D (dictionary). Extra keyword
+                arguments to be passed to the single plotting functions.
+                Internally a :class:`~matplotlib.image.AxesImage` is used for
+                2D plots (e.g. cmap, norm, vmin, vmax, interpolation) and
+                :func:`~mpl_toolkits.mplot3d.art3d.Axes3D.plot_surface` for
+                the 3D plot, that shows the projections on the back faces of
+                the bounding box (at xmin, ymax and zmin), coarsened to 64
+                cells per side at most.
+
+            kwargsShared (dictionary). Extra keyword arguments common to all plots.
+                Arguments specified via specific kwargs will always have the
+                precedence and won't be overwritten.
+
+            reduce (string). How the voxels along each projection direction
+                are combined: "max" (maximum intensity projection, ignoring
+                NaNs), "mean" or "sum". Default: "max"
+
+            workers (int). Number of threads reducing the volume.
+                Default: None, i.e., the number of CPUs
+        '''
+        if reduce not in ("max", "mean", "sum"):
+            raise ValueError("volume: unknown reduce '%s'" % reduce)
+        if np.ndim(V) != 3 or not np.size(V):
+            raise ValueError("volume: V must be a non-empty 3D array")
+
+        kwargs2D = self._kwargs2D(kwargsShared, kwargsXZ, kwargsYZ, kwargsXY)
+        kwargs3D = _merge_dicts(kwargsShared, kwargs3D)
+
+        V = np.asarray(V)
+        if extent is None:
+            extent = (0, V.shape[0], 0, V.shape[1], 0, V.shape[2])
+        xmin, xmax, ymin, ymax, zmin, zmax = extent
+        ranges = [(xmin, xmax), (ymin, ymax), (zmin, zmax)]
+        # images of the XZ, YZ and XY planes, keyed by the reduced coordinate
+        images = dict(zip((1, 0, 2), _projectVolume(V, reduce, workers)))
+
+        artists = {}
+        for view, kwargs in zip(self._projector.views, kwargs2D):
+            if view.columns is None:
+                # only the views along the coordinate axis show the volume
+                continue
+            first, last = view.coords
+            reduced = 3 - first - last
+            image = images[reduced] if first < last else images[reduced].T
+            (umin, umax), (vmin, vmax) = ranges[first], ranges[last]
+            kwargs = dict(kwargs)
+            # the image is not added through imshow, that would set the
+            # limits to its extent (undoing the inversion of the YZ axis)
+            artist = AxesImage(view.axis, origin='lower', extent=(umin, umax, vmin, vmax))
+            artist.set_data(image)
+            artist.set_clim(kwargs.pop('vmin', None), kwargs.pop('vmax', None))
+            artist.update(kwargs)
+            artist.autoscale_None()
+            view.axis.add_image(artist)
+            view.axis.update_datalim([(umin, vmin), (umax, vmax)])
+            view.axis.autoscale_view()
+            artists.setdefault(reduced, artist)
+
+        for reduced, (umin, umax), (vmin, vmax), wall in [
+                (1, ranges[0], ranges[2], lambda U, W: (U, np.full_like(U, ymax), W)),
+                (0, ranges[1], ranges[2], lambda U, W: (np.full_like(U, xmin), U, W)),
+                (2, ranges[0], ranges[1], lambda U, W: (U, W, np.full_like(U, zmin)))]:
+            artist = artists[reduced]
+            coarse, rows, columns = _coarsen(images[reduced], _VOLUME_3D_CELLS, reduce)
+            U, W = np.meshgrid(umin + columns * (umax - umin), vmin + rows * (vmax - vmin))
+            self._axis3D.plot_surface(*wall(U, W), **_merge_dicts(
+                {'facecolors': artist.to_rgba(coarse), 'shade': False,
+                 'rstride': 1, 'cstride': 1}, kwargs3D))
+
+    @property
+    def selection(self):
+        '''
+        The selected data point, as a (:class:`DataHandle`, index) tuple, or
+        None if nothing is selected.
+        '''
+        return self._selection
+
+    def link_selection(self, kwargsXZ=None, kwargsYZ=None, kwargsXY=None, kwargs3D=None,
+                       kwargsShared=None, mode="click", radius=5, callback=None):
+        '''
+        Enable the linked selection: clicking (or hovering) near a data point
+        on any 2D axis selects it and highlights the same point on all the
+        axis, 3D view included.
+
+        The points of every dataset returned by :func:`plot` and
+        :func:`scatter` are searched through a uniform grid built, for each
+        plane, on the first selection made on it (and after the data changes),
+        so that a selection only visits the points near the mouse, even with
+        millions of points.
+
+        Args:
+            kwargsXZ, kwargsYZ, kwargsXY, kwargs3D (dictionary). Extra keyword
+                arguments to be passed to the :class:`~matplotlib.lines.Line2D`
+                (:class:`~mpl_toolkits.mplot3d.art3d.Line3D` in 3D) highlighting
+                the selected point. Default: a red circle
+
+            kwargsShared (dictionary). Extra keyword arguments common to all plots.
+                Arguments specified via specific kwargs will always have the
+                precedence and won't be overwritten.
+
+            mode (string). Either "click", to select with the left button,
+                "hover", to select the point under the mouse, or None to
+                disable the selection. Default: "click"
+
+            radius (float). Maximum distance in pixels between the mouse and
+                the selected point. Default: 5
+
+            callback (callable). Called as callback(handle, index) when the
+                selection changes (with None, None when it is cleared).
+                Default: None
+        '''
+        if mode not in ("click", "hover", None):
+            raise ValueError("link_selection: unknown mode '%s'" % mode)
+
+        if self._selectionCid is not None:
+            self._fig.canvas.mpl_disconnect(self._selectionCid)
+            self._selectionCid = None
+        self.select(None)
+        self._removeHighlights()
+        if mode is None:
+            self._selectionOptions = None
+            return
+
+        self._selectionOptions = {
+            'kwargs': [_merge_dicts(_HIGHLIGHT_KWARGS, kwargs) for kwargs in
+                       self._kwargs2D(kwargsShared, kwargsXZ, kwargsYZ, kwargsXY)] +
+                      [_merge_dicts(_HIGHLIGHT_KWARGS, kwargsShared, kwargs3D)],
+            'radius': radius, 'callback': callback}
+        event = 'button_press_event' if mode == "click" else 'motion_notify_event'
+        self._selectionCid = self._fig.canvas.mpl_connect(event, self._onPick)
+
+    def select(self, handle=None, index=None):
+        '''
+        Select a data point, highlighting it on all the axis if the linked
+        selection is enabled (see :func:`link_selection`).
+
+        Args:
+            handle (:class:`DataHandle`). The dataset holding the point.
+                Default: None, i.e., clear the selection
+
+            index (int). The index of the point in the data of handle.
+        '''
+        selection = None if handle is None else (handle, int(index))
+        changed = selection != self._selection
+        self._selection = selection
+        if self._selectionOptions is None:
+            return
+        highlights = self._highlightArtists()
+        if selection is None:
+            for artist in highlights:
+                artist.set_visible(False)
+        else:
+            point = handle._points3D()[selection[1]]  # pylint: disable=protected-access
+            for artist, (u, v) in zip(highlights, self._projector.project(point)):
+                artist.set_data([u], [v])
+                artist.set_visible(True)
+            highlights[-1].set_data_3d(*[[value] for value in point])
+            highlights[-1].set_visible(True)
+        self._redraw(highlights)
+        callback = self._selectionOptions['callback']
+        if changed and callback is not None:
+            callback(*(selection or (None, None)))
+
+    def stats(self, reset=False):
+        '''
+        Return the statistics recorded by an instrumented object (see the
+        instrument argument of the constructor) as a dictionary with keys:
+
+            calls (dictionary). The count, total and last duration in seconds
+                of each plotting method, e.g. ``stats['calls']['plot']``.
+
+            draws (dictionary). The count, total and last duration of the
+                draws of the 'figure' and of each axis ('XZ', 'YZ', 'XY', the
+                auxiliary views 'AUX1', 'AUX2'... and '3D', the latter
+                including the 3D projection of its artists).
+
+            sync (dictionary). The count, total and last duration of the
+                synchronisation passes ('pass') and, inside them, of the
+                listeners refreshing the level-of-detail artists ('listeners').
+
+            callbacks (int). Number of limit change callbacks received.
+
+            interactions (list). Number of limit change callbacks received
+                before each of the last 100 draws following limit changes.
+
+            artists (dictionary). Number of data artists on each axis.
+
+        Args:
+            reset (bool). If True all the timings and counters are cleared
+                after being returned. Default: False
+        '''
+        if self._stats is None:
+            raise ValueError("stats: the object is not instrumented")
+        timings = self._stats.timings
+        result = {'calls': dict((name, dict(entry)) for name, entry in timings['call'].items()),
+                  'draws': dict((name, dict(entry)) for name, entry in timings['draw'].items()),
+                  'sync': dict((name, dict(entry)) for name, entry in timings['sync'].items()),
+                  'callbacks': self._stats.callbacks,
+                  'interactions': list(self._stats.interactions),
+                  'artists': dict((name, len(_dataArtists(axis)))
+                                  for name, axis in self._panes())}
+        if reset:
+            self._stats.reset()
+        return result
+
+    def reset(self):
+        '''
+        Remove all the plotted data, keeping the figure, the axis with their
+        titles, labels and orientation, and their synchronisation, so that
+        the object can be reused for a new dataset at a fraction of the cost
+        of building a new one. The ranges, margins, autoscaling and colour
+        cycle of the axis are the ones of a new object.
+        '''
+        margins, ranges = self._initialState
+        self._lodArtists = []
+        with self._limits.hold():
+            for _, axis in self._panes():
+                for artist in _dataArtists(axis)[::-1]:
+                    artist.remove()
+                axis.relim()
+                if axis is self._axis3D:
+                    axis.xy_dataLim.set(Bbox.null())
+                    axis.zz_dataLim.set(Bbox.null())
+                axis.margins(*margins[axis])
+                axis.set_prop_cycle(None)
+            self._limits.set(**ranges)
+        # setting the limits turns the autoscaling off
+        for _, axis in self._panes():
+            axis.set_autoscale_on(True)
+        self._backgrounds = None
+        self._datasets = []
+        self._selection = None
+        self._highlights = None
+
+    def savefig(self, fname, **kwargs):
+        '''
+        Save the figure.
+
+        Args:
+            fname (string or file-like object). Where to save the figure.
+
+            kwargs. Extra keyword arguments passed to
+                :func:`~matplotlib.figure.Figure.savefig` (e.g. format, dpi).
+        '''
+        self._fig.savefig(fname, **kwargs)
+
+    def to_bytes(self, format='png', **kwargs):  # pylint: disable=redefined-builtin
+        '''
+        Render the figure and return the content of the resulting file.
+
+        Args:
+            format (string). The file format, e.g. 'png', 'pdf' or 'svg'.
+                Default: 'png'
+
+            kwargs. Extra keyword arguments passed to
+                :func:`~matplotlib.figure.Figure.savefig` (e.g. dpi).
+
+        Returns:
+            The rendered figure as bytes.
+        '''
+        buf = BytesIO()
+        self._fig.savefig(buf, format=format, **kwargs)
+        return buf.getvalue()
+
+    def export(self, fname, max_elements=10000, dpi=150, **kwargs):
+        '''
+        Save the figure choosing raster or vector output per artist: in
+        vector formats (e.g. PDF, SVG) the data artists drawing more than
+        max_elements vertices or markers are rasterized at dpi, while the
+        axis, labels and smaller artists stay vector. The size of the file
+        is then bounded by the resolution of the figure instead of the size
+        of the data.
+
+        Args:
+            fname (string or file-like object). Where to save the figure.
+
+            max_elements (int). Largest number of vertices or markers of an
+                artist saved as vector. Default: 10000
+
+            dpi (float). Resolution of the rasterized artists (and of raster
+                formats). Default: 150
+
+            kwargs. Extra keyword arguments passed to
+                :func:`~matplotlib.figure.Figure.savefig` (e.g. format).
+        '''
+        rasterized = [artist for _, axis in self._panes() for artist in _dataArtists(axis)
+                      if not artist.get_rasterized() and
+                      _elementCount(artist, max_elements) > max_elements]
+        with warnings.catch_warnings():
+            # the 3D collections do not declare their support of rasterization,
+            # but are rasterized by their axis all the same
+            warnings.filterwarnings('ignore', message='Rasterization of')
+            for artist in rasterized:
+                artist.set_rasterized(True)
+        try:
+            self._fig.savefig(fname, dpi=dpi, **kwargs)
+        finally:
+            for artist in rasterized:
+                artist.set_rasterized(False)
+
+    def animate(self, handles, frames, func=None, interval=50, blit=True):
+        '''
+        Animate the data of one or more plots, replacing it at every frame
+        and redrawing all the axis together.
+
+        Args:
+            handles (:class:`DataHandle` or list). The handles returned by
+                :func:`plot` or :func:`scatter` whose data is animated.
+
+            frames (iterable). The data of each frame, e.g. a generator. For a
+                single handle each frame is an (N, 3) array or an (x, y, z)
+                tuple of arrays, for a list of handles a sequence with the
+                data of each handle (None to leave it unchanged).
+
+            func (callable). Called as func(proj, index) after the data of
+                each frame is set, e.g. to move the limits with
+                ``proj.limits.set`` for a fly-through. Default: None
+
+            interval (int). Delay between frames in milliseconds. Default: 50
+
+            blit (bool). If True the artists of the handles are animated: only
+                them are redrawn at every frame, blitting them on the saved
+                background of the axis. Limits changed by func are only shown
+                by full redraws: use False when they change. Default: True
+
+        Returns:
+            The started :class:`~matplotlib.backend_bases.TimerBase` driving
+            the animation. Keep a reference to it while the animation runs and
+            call its stop method to stop it.
+        '''
+        handles = handles if isinstance(handles, (list, tuple)) else [handles]
+        artists = [artist for handle in handles for artist in handle.artists]
+        animated = dict((artist, artist.get_animated()) for artist in artists)
+        for artist in artists:
+            artist.set_animated(blit or animated[artist])
+        if blit and not all(animated.values()):
+            # the background must be saved without the animated artists
+            self._backgrounds = None
+            self._fig.canvas.draw_idle()
+
+        frames = enumerate(frames)
+        timer = self._fig.canvas.new_timer(interval=interval)
+
+        def step():
+            try:
+                index, frame = next(frames)
+            except StopIteration:
+                timer.stop()
+                for artist, wasAnimated in animated.items():
+                    artist.set_animated(wasAnimated)
+                self._fig.canvas.draw_idle()
+                return
+            self._showFrame(handles, index, frame, func)
+            self._redraw(artists)
+
+        timer.add_callback(step)
+        timer.start()
+        return timer
+
+    def save_animation(self, fname, handles, frames, func=None, fps=20, writer=None,
+                       workers=1, **kwargs):
+        '''
+        Render an animation (see :func:`animate`) frame by frame off-screen,
+        writing it to a video or to a sequence of images.
+
+        Args:
+            fname (string). The output file. If it contains a % format
+                (e.g. 'frame_%04d.png') each frame is saved as an image,
+                named after its index, otherwise a video is written.
+
+            handles, frames, func. As in :func:`animate`.
+
+            fps (int). Frames per second of the video. Default: 20
+
+            writer (string or :class:`~matplotlib.animation.MovieWriter`). The
+                writer of the video, e.g. 'ffmpeg'. Default: None, i.e.,
+                'pillow' for GIF files and 'ffmpeg' otherwise
+
+            workers (int). Number of processes saving the images of a
+                sequence, each drawing the frames on its own copy of the
+                figure (forked from this process, so that nothing is
+                pickled but the frames). func must then only depend on the
+                frame index. Videos are always written by this process.
+                Default: 1
+
+            kwargs. Extra keyword arguments passed to
+                :func:`~matplotlib.figure.Figure.savefig` (e.g. dpi).
+        '''
+        handles = handles if isinstance(handles, (list, tuple)) else [handles]
+        # animated artists are not drawn when saving
+        animated = [artist for handle in handles for artist in handle.artists
+                    if artist.get_animated()]
+        for artist in animated:
+            artist.set_animated(False)
+        try:
+            if '%' not in fname:
+                self._saveVideo(fname, handles, frames, func, fps, writer, kwargs)
+            elif workers > 1 and 'fork' in multiprocessing.get_all_start_methods():
+                self._saveFramesParallel(fname, handles, frames, func, workers, kwargs)
+            else:
+                for index, frame in enumerate(frames):
+                    self._showFrame(handles, index, frame, func)
+                    self.savefig(fname % index, **kwargs)
+        finally:
+            for artist in animated:
+                artist.set_animated(True)
+
+    def close(self):
+        '''
+        Close the figure and release all its artists. The object cannot be
+        used anymore afterwards.
+        '''
+        if self._fig is None:
+            return
+        if not self._headless:
+            import matplotlib.pyplot as plt
+            plt.close(self._fig)
+        self._fig.clear()
+        self._lodArtists = []
+        self._backgrounds = None
+        self._datasets = []
+        self._selection = self._highlights = self._selectionOptions = None
+        self._fig = None
+        self._axisXZ = self._axisYZ = self._axisXY = self._axis3D = None
+        self._projector = self._views = self._limits = self._initialState = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def show(self, block=False):
+        """
+        Display the figure.
+
+        Args:
+            block (bool). If True the computation is blocked waiting for
+                user's input. Default: False
+        """
+        self._fig.show()
+        if block:
+            input("Press any key to continue")
+
+    # ###############
+    # Private Methods
+    # ###############
+
+    def _panes(self):
+        """
+        Function that returns the (name, axis) pairs of the 2D views (XZ, YZ,
+        XY, then AUX1, AUX2... for the auxiliary ones) and of the 3D axis
+        """
+        return [(view.name, view.axis) for view in self._projector.views] + \
+            [('3D', self._axis3D)]
+
+    def _kwargs2D(self, kwargsShared, kwargsXZ, kwargsYZ, kwargsXY):
+        """
+        Function that returns the keyword arguments of each 2D view, merged
+        with the shared ones (that are the only ones of the auxiliary views)
+        """
+        kwargs = {'XZ': kwargsXZ, 'YZ': kwargsYZ, 'XY': kwargsXY}
+        return [_merge_dicts(kwargsShared, kwargs.get(view.name))
+                for view in self._projector.views]
+
+    def _dataBounds(self, relim=False):
+        """
+        Function that returns the (min, max) limits fitting the data of all
+        the axis for each coordinate (None if there is no data), with the
+        largest of the margins of the axis showing it.
+        If relim is True the data limits of the 2D views are recomputed from
+        their artists first, and the ones of the 3D axis (showing the same
+        data, but that can only grow) are not used.
+        """
+        if relim:
+            self._relim()
+        bounds = {}
+        for coord, views in self._views.items():
+            if relim:
+                views = [(axis, axisCoord) for axis, axisCoord in views
+                         if axis is not self._axis3D]
+            intervals = np.array([_dataInterval(axis, axisCoord) for axis, axisCoord in views])
+            low, high = intervals[:, 0].min(), intervals[:, 1].max()
+            if not np.isfinite([low, high]).all():
+                bounds[coord] = None
+                continue
+            margin = max(axis.margins()['xyz'.index(axisCoord)] for axis, axisCoord in views)
+            axis, axisCoord = views[0]
+            locator = getattr(axis, '%saxis' % axisCoord).get_major_locator()
+            low, high = locator.nonsingular(low, high)
+            margin *= high - low
+            bounds[coord] = (low - margin, high + margin)
+        return bounds
+
+    def _relim(self):
+        """
+        Function that recomputes the data limits of the 2D views from their
+        artists, the level-of-detail lines and the density images counting
+        for all their points (not only the ones drawn)
+        """
+        intervals = dict((lodLine.line, lodLine.interval()) for lodLine in self._lodArtists)
+        for view in self._projector.views:
+            axis = view.axis
+            with ExitStack() as stack:
+                for image in axis.images:
+                    if isinstance(image, _DensityImage):
+                        stack.enter_context(image.dataExtent())
+                axis.relim()
+            for artist in axis.get_children():
+                if isinstance(artist, Collection):
+                    # older versions of Axes.relim skip the collections
+                    interval = artist.get_datalim(axis.transData).get_points()
+                else:
+                    interval = intervals.get(artist)
+                if interval is not None and np.isfinite(interval).all():
+                    axis.update_datalim(interval)
+
+    def _autoscaleData(self):
+        """
+        Function that fits the ranges of the coordinates shown by autoscaling
+        axis to the data, after the data of a dataset changed
+        """
+        autoscale = {}
+        for views in self._views.values():
+            for axis, axisCoord in views:
+                autoscale[axis, axisCoord] = getattr(axis, 'get_autoscale%s_on' % axisCoord)()
+        bounds = self._dataBounds(relim=True)
+        ranges = dict((coord, bounds[coord]) for coord, views in self._views.items()
+                      if bounds[coord] is not None and
+                      bounds[coord] != getattr(self._limits, coord) and
+                      any(autoscale[view] for view in views))
+        if not ranges:
+            return
+        self._limits.set(**ranges)
+        # setting the limits turns the autoscaling off
+        for (axis, axisCoord), on in autoscale.items():
+            getattr(axis, 'set_autoscale%s_on' % axisCoord)(on)
+
+    def _handle(self, points, artists, update, animated, autoscale=False):
+        """
+        Function that builds the DataHandle of a plotting call
+        """
+        for artist in artists:
+            artist.set_animated(animated)
+        handle = DataHandle(self, points, artists, update, autoscale)
+        self._datasets.append(handle)
+        return handle
+
+    def _showFrame(self, handles, index, frame, func):
+        """
+        Function that sets the data of the handles to the given frame of an
+        animation and calls func
+        """
+        for handle, data in zip(handles, [frame] if len(handles) == 1 else frame):
+            if data is not None:
+                handle._replace(_framePoints(data))  # pylint: disable=protected-access
+        if func is not None:
+            func(self, index)
+
+    def _saveVideo(self, fname, handles, frames, func, fps, writer, kwargs):
+        """
+        Function that writes the frames of an animation to a video
+        """
+        from matplotlib.animation import writers
+        if writer is None:
+            writer = 'pillow' if fname.lower().endswith('.gif') else 'ffmpeg'
+        if isinstance(writer, str):
+            writer = writers[writer](fps=fps)
+        dpi = kwargs.pop('dpi', None) or self._fig.dpi
+        with writer.saving(self._fig, fname, dpi):
+            for index, frame in enumerate(frames):
+                self._showFrame(handles, index, frame, func)
+                writer.grab_frame(**kwargs)
+
+    def _saveFramesParallel(self, fname, handles, frames, func, workers, kwargs):
+        """
+        Function that saves the frames of an animation as images from a pool
+        of forked processes, keeping at most two frames per process queued
+        """
+        context = multiprocessing.get_context('fork')
+        pending = deque()
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                 initializer=_initFrameWorker,
+                                 initargs=((self, handles, func, fname, kwargs),)) as executor:
+            for index, frame in enumerate(frames):
+                pending.append(executor.submit(_saveFrame, index, frame))
+                if len(pending) >= 2 * workers:
+                    pending.popleft().result()
+            while pending:
+                pending.popleft().result()
+
+    def _dataChanged(self, handle):
+        """
+        Function that moves the highlight of the selected point after the data
+        of its dataset changed, clearing the selection if it is gone
+        """
+        if self._selection is None or self._selection[0] is not handle:
+            return
+        index = self._selection[1]
+        if index < len(handle._points3D()):  # pylint: disable=protected-access
+            self._selection = None
+            self.select(handle, index)
+        else:
+            self.select(None)
+
+    def _highlightArtists(self):
+        """
+        Function that returns the artists highlighting the selected point on
+        each 2D view and in 3D, creating them on first use. They are animated
+        (i.e., blitted on the saved backgrounds) unless the figure is headless
+        """
+        if self._highlights is None:
+            self._highlights = []
+            kwargs = self._selectionOptions['kwargs']
+            artists = [(view.axis, Line2D([], [], **kwargs2D))
+                       for view, kwargs2D in zip(self._projector.views, kwargs)]
+            artists.append((self._axis3D, Line3D([], [], [], **kwargs[-1])))
+            for axis, artist in artists:
+                # added as a bare artist: it does not change the data limits
+                axis.add_artist(artist)
+                artist.set_visible(False)
+                artist.set_animated(not self._headless)
+                self._highlights.append(artist)
+        return self._highlights
+
+    def _removeHighlights(self):
+        """
+        Function that removes the artists highlighting the selected point
+        """
+        for artist in self._highlights or []:
+            artist.remove()
+        self._highlights = None
+
+    def _onPick(self, event):
+        """
+        Callback that selects the data point nearest to a click (or to the
+        mouse) on a 2D axis, searching every dataset through its grid index
+        on the view of the axis
+        """
+        view = dict((view.axis, view) for view in self._projector.views).get(event.inaxes)
+        if view is None or event.canvas is not self._fig.canvas:
+            return
+        if event.name == 'button_press_event' and event.button != 1:
+            return
+        toolbar = getattr(event.canvas, 'toolbar', None)
+        if toolbar is not None and toolbar.mode:
+            # panning or zooming
+            return
+
+        best = None
+        radius = self._selectionOptions['radius']
+        for handle in self._datasets:
+            found = handle._index(view).nearest(  # pylint: disable=protected-access
+                event.inaxes.transData, event.x, event.y, radius)
+            if found is not None and (best is None or found[1] < best[2]):
+                best = (handle, found[0], found[1])
+        if best is None:
+            if self._selection is not None:
+                self.select(None)
+        elif (best[0], best[1]) != self._selection:
+            self.select(best[0], best[1])
+
+    def _redraw(self, artists):
+        """
+        Function that redraws the given artists after their data changed.
+        Animated artists are blitted on the saved background of their axis,
+        otherwise a redraw of the whole figure is requested.
+        """
+        canvas = self._fig.canvas
+        if self._headless:
+            # the figure is only rendered when saved
+            return
+        if self._backgrounds is None or not all(a.get_animated() for a in artists):
+            canvas.draw_idle()
+            return
+
+        for axis in set(artist.axes for artist in artists):
+            canvas.restore_region(self._backgrounds[axis])
+            self._drawAnimated(axis)
+            canvas.blit(axis.bbox)
+        canvas.flush_events()
+
+    def _drawAnimated(self, axis):
+        """
+        Function that draws all the animated artists of the given axis
+        """
+        for artist in axis.get_children():
+            if artist.get_animated():
+                axis.draw_artist(artist)
+
+    def _onDraw(self, event):
+        """
+        Callback that saves the background of each axis after a full draw and
+        draws the animated artists on top of it
+        """
+        canvas = self._fig.canvas
+        if (event.canvas is not canvas or canvas.is_saving() or
+                not getattr(canvas, 'supports_blit', False)):
+            return
+        axes = [axis for _, axis in self._panes()]
+        self._backgrounds = dict((axis, canvas.copy_from_bbox(axis.bbox)) for axis in axes)
+        for axis in axes:
+            self._drawAnimated(axis)
+
+    def _plot2DGraphs(self, points, kwargs2D):
+        """
+        Function that plot an (N, 3) array of points on the 2D views as simple
+        plots drawing their projections and returns the lines
+        """
+        lines = []
+        for view, projected, kwargs in zip(self._projector.views,
+                                           self._projector.project(points), kwargs2D):
+            kwargs = dict(kwargs or {})
+            if 'color' not in kwargs and 'c' not in kwargs:
+                cycle = view.axis._get_lines  # pylint: disable=protected-access
+                kwargs['color'] = cycle.get_next_color()
+            line = _SharedLine(projected, **kwargs)
+            view.axis.add_line(line)
+            view.axis.autoscale_view()
+            lines.append(line)
+        return lines
+
+    def _lodPlot(self, points, kwargs2D, kwargs3D):
+        """
+        Function that plot the points of a _Chunks on all the axis with
+        level-of-detail lines and returns the artists and a function updating
+        their data
+        """
+        lodLines = []
+        for view, kwargs in zip(self._projector.views, kwargs2D):
+            lodLine = _LODLine(view.axis, _ProjectedChunks(points, view))
+            lodLine.line, = view.axis.plot(*lodLine.decimated(), **kwargs)
+            lodLines.append(lodLine)
+        self._lodArtists.extend(lodLines)
+
+        kept = _minmaxDecimate(points, [0, 1, 2], 0, len(points), _pixelWidth(self._axis3D))
+        line3D, = self._axis3D.plot(kept[:, 0], kept[:, 1], kept[:, 2], **kwargs3D)
+
+        def update(points):
+            points = _Chunks(points)
+            for lodLine, view in zip(lodLines, self._projector.views):
+                lodLine.set_points(_ProjectedChunks(points, view))
+                lodLine.refresh()
+            kept = _minmaxDecimate(points, [0, 1, 2], 0, len(points),
+                                   _pixelWidth(self._axis3D))
+            line3D.set_data_3d(kept[:, 0], kept[:, 1], kept[:, 2])
+
+        return [lodLine.line for lodLine in lodLines] + [line3D], update
+
+    def _densityScatter(self, points, kwargs2D, kwargs3D):
+        """
+        Function that plot the points of a _Chunks on the 2D views as density
+        images and on the 3D axis as a subsampled scatter and returns the
+        artists and a function updating their data
+        """
+        low, high = points.bounds()
+        images = []
+        for view, kwargs in zip(self._projector.views, kwargs2D):
+            axis = view.axis
+            image = _DensityImage(axis, _ProjectedChunks(points, view), **kwargs)
+            axis.add_image(image)
+            # the projection of the bounding box of the points
+            image.interval = view.interval(low, high)
+            if np.isfinite([low, high]).all():
+                axis.update_datalim(image.interval)
+                axis.autoscale_view()
+            image.refresh()
+            images.append(image)
+
+        sample, step = _subsample(points, _DENSITY_3D_POINTS)
+        kwargs3D = dict((key, value[::step] if np.ndim(value) and len(value) == len(points)
+                         else value) for key, value in kwargs3D.items())
+        scatter3D = self._axis3D.scatter(sample[:, 0], sample[:, 1], sample[:, 2], **kwargs3D)
+
+        def update(points):
+            points = _Chunks(points)
+            low, high = points.bounds()
+            for image, view in zip(images, self._projector.views):
+                image.points = _ProjectedChunks(points, view)
+                image.interval = view.interval(low, high)
+                image.invalidate()
+                image.refresh()
+            sample, _ = _subsample(points, _DENSITY_3D_POINTS)
+            _shareOffsets3D(scatter3D, sample)
+
+        return images + [scatter3D], update
+
+    def _updateLOD(self, coords=None):  # pylint: disable=unused-argument
+        """
+        Callback that refreshes the level-of-detail artists on limits change
+        """
+        for artist in self._lodArtists:
+            artist.refresh()
+
+    def _wireframe2DGraphs(self, X, Y, Z, kwargs2D):
+        """
+        Function that plot data on the 2D views as a wireframe, using a single
+        LineCollection per axis holding all the rows and columns of the grid
+        """
+        grid = np.stack((np.asarray(X), np.asarray(Y), np.asarray(Z)), axis=-1)
+        for view, projected, kwargs in zip(self._projector.views,
+                                           self._projector.project(grid), kwargs2D):
+            segments = list(projected) + list(projected.swapaxes(0, 1))
+            if kwargs is None:
+                view.axis.add_collection(LineCollection(segments))
+            else:
+                view.axis.add_collection(LineCollection(segments, **kwargs))
+            view.axis.autoscale_view()
+
+    def _silhouette2DGraphs(self, verts, filled, kwargs2D):
+        """
+        Function that plot the outline of the projection of an (F, V, 3) array
+        of polygons on the 2D views, or the region it encloses if filled, as a
+        single collection per axis
+        """
+        for view, projected, kwargs in zip(self._projector.views,
+                                           self._projector.project(verts), kwargs2D):
+            paths = _silhouette(projected, filled)
+            if kwargs is None:
+                kwargs = {}
+            if filled:
+                view.axis.add_collection(PathCollection(paths, **kwargs))
+            else:
+                view.axis.add_collection(LineCollection([path.vertices for path in paths],
+                                                        **kwargs))
+            view.axis.autoscale_view()
+
+    def _scatter2DGraphs(self, points, kwargs2D):
+        """
+        Function that plot an (N, 3) array of points on the 2D views as scatter
+        plots and returns the collections
+        """
+        scatters = []
+        for view, projected, kwargs in zip(self._projector.views,
+                                           self._projector.project(points), kwargs2D):
+            if kwargs is None:
+                scatters.append(view.axis.scatter(projected[:, 0], projected[:, 1]))
+            else:
+                scatters.append(view.axis.scatter(projected[:, 0], projected[:, 1], **kwargs))
+        return scatters
+
+    def _polygons(self, verts, kwargs2D, kwargs3D, depthsort=False):
+        """
+        Function that plot an (F, V, 3) array of polygons on all the axis
+        """
+        self._collection2DGraphs(verts, kwargs2D, depthsort)
+        if kwargs3D is None:
+            self._axis3D.add_collection3d(Poly3DCollection(verts))
+        else:
+            self._axis3D.add_collection3d(Poly3DCollection(verts, **kwargs3D))
+
+    def _collection2DGraphs(self, verts, kwargs2D, depthsort=False):
+        """
+        Function that plot an (F, V, 3) array of polygons on the 2D views as
+        collections. The projected vertices of the views along the coordinate
+        axis are views of verts unless the polygons are sorted by depth.
+        """
+        for view, projected, kwargs in zip(self._projector.views,
+                                           self._projector.project(verts), kwargs2D):
+            axis = view.axis
+            if kwargs is None:
+                kwargs = {}
+            if depthsort and len(verts) > 1:
+                # the depth of a face is the position of its nearest vertex
+                # along the direction of the viewer: the lower the farther
+                depth = np.dot(verts, view.direction).max(axis=1)
+                order = np.argsort(depth, kind='stable')
+                projected = projected[order]
+                kwargs = _reorderFaces(kwargs, order)
+            axis.add_collection(PolyCollection(projected, **kwargs))
@@ -0,0 +1,725 @@
+# Copyright (c) 2016 Alessandro Pietro Bardelli
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Module containing functions to render orthogonal projections described by
+job specifications, one at a time or many in parallel.
+
+A job is a dictionary with the following keys:
+
+    calls (list). The :class:`~orthoproj.OrthoProj` plotting calls, as
+        (method, args) or (method, args, kwargs) tuples, e.g.
+        ``('plot', (x, y, z), {'kwargsShared': {'color': 'r'}})``.
+
+    name (string). Name of the output file, without extension (only used by
+        :func:`render_many`). Default: the index of the job.
+
+    format (string). Output file format. Default: 'png'
+
+    savefig (dictionary). Extra keyword arguments for
+        :func:`~orthoproj.OrthoProj.savefig` (e.g. dpi). Default: None
+
+    figsize (tuple). Size of the figure in inches. Default: None, i.e.,
+        rcParams['figure.figsize']
+
+    limits (dictionary). Ranges of the coordinates set after the calls, as
+        keyword arguments of :func:`~orthoproj.LimitSync.set`, e.g.
+        ``{'x': (0, 1), 'z': (-1, 1)}``. Default: None, i.e., autoscaled
+
+Rendered jobs can be stored in a :class:`RenderCache`, so that a job that
+was already rendered is answered with the stored bytes without building
+any figure.
+
+Event loops render with :func:`render_async`, which runs the jobs on the
+workers of a bounded :class:`RenderPool` instead of blocking the loop.
+"""
+# pylint: disable=invalid-name
+import asyncio
+import gc
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from collections import namedtuple, OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import matplotlib
+from matplotlib.colors import Colormap, Normalize
+from matplotlib.scale import ScaleBase
+from matplotlib.transforms import TransformNode
+import numpy as np
+from .orthogonal_projection import OrthoProj
+
+# OrthoProj methods that can be called by a job
+_JOB_METHODS = ('plot', 'scatter', 'plot_trisurf', 'plot_surface', 'plot_wireframe',
+                'plot_collection', 'plot_collections', 'volume')
+
+# Arrays smaller than this number of bytes are pickled to the workers
+_SHARED_MIN_BYTES = 1 << 16
+
+RenderResult = namedtuple('RenderResult',
+                          ['name', 'path', 'build_time', 'render_time', 'error'])
+RenderResult.__doc__ = '''
+Outcome of a job rendered by :func:`render_many`: the output path, the
+seconds spent building the figure and rendering it (a job found in the
+cache has a build time of 0 and the lookup as render time), and the error
+message if the job failed (None otherwise).
+'''
+
+# Per-thread state of the rendering functions
+_local = threading.local()
+
+# Jobs submitted at once to a RenderPool, per worker, by default
+_POOL_PENDING = 2
+
+# RenderPool used by render_async when none is given
+_defaultPool = None
+_defaultPoolLock = threading.Lock()
+
+# Placeholder of an array moved to shared memory
+_SharedArray = namedtuple('_SharedArray', ['name', 'shape', 'dtype'])
+
+
+# Files of the on-disk tier of a RenderCache
+_CACHE_SUFFIX = '.render'
+
+# Bytes of a strided array copied at once to be hashed
+_HASH_CHUNK_BYTES = 1 << 22
+
+# Scalars hashed with their repr
+_HASH_SCALARS = (type(None), bool, int, float, complex, str, bytes, np.generic)
+
+# Attributes of norms, scales and transforms that are not part of their
+# content: the registered callbacks and the caches of the transform tree
+_HASH_IGNORED = frozenset(('callbacks', '_parents', '_invalid', '_shorthand_name',
+                           '_log_funcs'))
+
+
+class RenderCache():
+    '''
+    Cache of rendered jobs, addressed by their content: the key of a job is
+    a hash of the bytes, dtype and shape of its arrays, of its calls with
+    their arguments, of its output options (format, savefig, figsize and
+    limits) and of the matplotlib version, backend and rcParams (e.g. the
+    style, fonts, figure size and dpi). Two jobs plotting the same data with
+    the same options share the entry, whatever their name and wherever their
+    arrays come from. Colormaps and norms are hashed by their content; jobs
+    holding other objects (e.g. functions) are not cached.
+
+    Entries are kept in memory, dropping the least recently used ones
+    beyond max_memory bytes, and if directory is given also on disk,
+    dropping the least recently used files beyond max_disk bytes. The disk
+    tier can be shared by several processes and survives them; its size is
+    enforced on the files found when the cache is created and on those it
+    writes.
+
+    The cache can be used from several threads at once.
+    '''
+
+    def __init__(self, max_memory=1 << 26, directory=None, max_disk=1 << 30):
+        """
+        Args:
+            max_memory (int). Maximum number of bytes of rendered jobs kept
+                in memory. Default: 64MiB
+
+            directory (string). Directory of the on-disk tier, created if
+                missing. Default: None, i.e., memory only
+
+            max_disk (int). Maximum number of bytes of rendered jobs kept in
+                directory. Default: 1GiB
+        """
+        self.max_memory = max_memory
+        self.directory = directory
+        self.max_disk = max_disk
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._memory = OrderedDict()
+        self._memoryBytes = 0
+        self._disk = OrderedDict()
+        self._diskBytes = 0
+
+        if directory is not None:
+            if not os.path.isdir(directory):
+                os.makedirs(directory)
+            files = []
+            for entry in os.scandir(directory):
+                if entry.name.endswith(_CACHE_SUFFIX):
+                    stat = entry.stat()
+                    files.append((stat.st_mtime, entry.name[:-len(_CACHE_SUFFIX)],
+                                  stat.st_size))
+            for _, key, size in sorted(files):
+                self._disk[key] = size
+                self._diskBytes += size
+            self._evictDisk()
+
+    def key(self, job):
+        '''
+        Return the key of a job (see the module documentation), as an
+        hexadecimal string, or None if the job holds objects that cannot be
+        hashed by their content.
+        '''
+        digest = hashlib.blake2b(digest_size=20)
+        # reading the backend of a copy of rcParams does not select one
+        rc = matplotlib.rcParams.copy()
+        backend = rc['backend'] if isinstance(rc['backend'], str) else None
+        settings = [(name, repr(rc[name])) for name in sorted(rc) if name != 'backend']
+        if not _hashValue(digest, (matplotlib.__version__, backend, settings, job['calls'],
+                                   job.get('format', 'png'), job.get('savefig'),
+                                   job.get('figsize'), job.get('limits'))):
+            return None
+        return digest.hexdigest()
+
+    def get(self, key):
+        '''
+        Return the rendered bytes stored with key, or None if missing. An
+        entry found on disk is kept in memory too.
+        '''
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return data
+
+        if self.directory is not None:
+            path = self._path(key)
+            try:
+                with open(path, 'rb') as f:
+                    data = f.read()
+                # the modification time orders the files by last use
+                os.utime(path)
+            except OSError:
+                data = None
+            if data is not None:
+                with self._lock:
+                    if key in self._disk:
+                        self._disk.move_to_end(key)
+                    self._remember(key, data)
+                    self.hits += 1
+                return data
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key, data):
+        '''
+        Store the rendered bytes data with key.
+        '''
+        with self._lock:
+            self._remember(key, data)
+
+        if self.directory is not None:
+            # write a temporary file first, so that other processes never
+            # read a partial entry
+            fd, tmp = tempfile.mkstemp(dir=self.directory)
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp, self._path(key))
+            except OSError:
+                os.remove(tmp)
+                raise
+            with self._lock:
+                self._diskBytes += len(data) - self._disk.pop(key, 0)
+                self._disk[key] = len(data)
+                self._evictDisk()
+
+    def clear(self):
+        '''
+        Remove all the entries, from memory and from disk.
+        '''
+        with self._lock:
+            self._memory.clear()
+            self._memoryBytes = 0
+            while self._disk:
+                self._removeFile(self._disk.popitem()[0])
+            self._diskBytes = 0
+
+    def _path(self, key):
+        """
+        Function that returns the file of key in the on-disk tier.
+        """
+        return os.path.join(self.directory, key + _CACHE_SUFFIX)
+
+    def _remember(self, key, data):
+        """
+        Function that keeps data in memory, evicting the least recently used
+        entries beyond max_memory. To be called holding the lock.
+        """
+        if key in self._memory:
+            self._memoryBytes -= len(self._memory.pop(key))
+        if len(data) > self.max_memory:
+            return
+        self._memory[key] = data
+        self._memoryBytes += len(data)
+        while self._memoryBytes > self.max_memory:
+            self._memoryBytes -= len(self._memory.popitem(last=False)[1])
+
+    def _evictDisk(self):
+        """
+        Function that removes the least recently used files beyond max_disk.
+        To be called holding the lock.
+        """
+        while self._diskBytes > self.max_disk and self._disk:
+            key, size = self._disk.popitem(last=False)
+            self._diskBytes -= size
+            self._removeFile(key)
+
+    def _removeFile(self, key):
+        """
+        Function that removes the file of key, if still there.
+        """
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+
+def render(job, fname=None, cache=None):
+    '''
+    Render a single job with a headless :class:`~orthoproj.OrthoProj`.
+
+    Args:
+        job (dictionary). The job specification (see the module documentation).
+
+        fname (string or file-like object). Where to save the figure.
+            Default: None, i.e., return the rendered bytes
+
+        cache (:class:`RenderCache`). Cache looked up before rendering, and
+            updated after. Default: None
+
+    Returns:
+        The rendered figure as bytes if fname is None, None otherwise.
+    '''
+    key = None if cache is None else cache.key(job)
+    if key is None:
+        return _render(job, fname)[0]
+
+    data = cache.get(key)
+    if data is None:
+        data = _render(job)[0]
+        cache.put(key, data)
+    if fname is None:
+        return data
+    _write(fname, data)
+    return None
+
+
+class RenderPool():
+    '''
+    Bounded pool of workers rendering jobs for :func:`render_async`. Each
+    worker (a process, or a thread) renders with its own headless
+    :class:`~orthoproj.OrthoProj`, so figures are never shared between
+    concurrent jobs and pyplot is never involved.
+
+    At most max_pending jobs are handed to the workers at once. The others
+    wait inside :func:`render_async`, in arrival order, without queueing
+    anything: a burst of requests is served at the pace of the workers and
+    its callers are slowed down accordingly.
+
+    The bound applies to the jobs of the current event loop. A pool is
+    closed with :func:`close` or as a context manager.
+    '''
+
+    def __init__(self, workers=None, processes=True, max_pending=None):
+        """
+        Args:
+            workers (int). Number of workers. Default: None, i.e., the number
+                of CPUs
+
+            processes (bool). If True the workers are processes, rendering in
+                parallel on all the cores; the arrays of the jobs are pickled
+                to them. If False they are threads of the calling process,
+                sharing its memory but serialised by the GIL for most of the
+                rendering. Default: True
+
+            max_pending (int). Maximum number of jobs submitted to the
+                workers at once, running or queued. Default: None, i.e.,
+                twice the number of workers
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending or _POOL_PENDING * self.workers
+        if processes:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers,
+                                                thread_name_prefix='orthoproj-render')
+        self._slots = None
+        self._pending = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def pending(self):
+        '''
+        Number of jobs submitted to the workers and not yet finished.
+        '''
+        return self._pending
+
+    async def submit(self, job):
+        '''
+        Coroutine rendering a job on a worker, once fewer than max_pending
+        jobs are submitted, and returning the rendered bytes.
+
+        Cancelling it while the job waits withdraws the job. A job already
+        rendering completes on its worker, which keeps its slot until then,
+        and its result is discarded.
+        '''
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._slots[0] is not loop:
+            self._slots = (loop, asyncio.Semaphore(self.max_pending))
+        slots = self._slots[1]
+        await slots.acquire()
+        try:
+            future = self._executor.submit(render, job)
+        except BaseException:
+            slots.release()
+            raise
+        self._pending += 1
+
+        def release(_):
+            self._pending -= 1
+            slots.release()
+
+        future.add_done_callback(lambda done: loop.call_soon_threadsafe(release, done))
+        # cancelling the wrapper also cancels the job if it did not start yet
+        return await asyncio.wrap_future(future)
+
+    def close(self, wait=True):
+        '''
+        Shut the workers down, cancelling the jobs that did not start.
+
+        Args:
+            wait (bool). If True, wait for the running jobs to finish.
+                Default: True
+        '''
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+async def render_async(job, fname=None, cache=None, pool=None):
+    '''
+    Coroutine rendering a single job on a :class:`RenderPool`, so that the
+    event loop keeps serving other requests meanwhile. Concurrent calls
+    render in parallel on the workers of the pool (see :class:`RenderPool`
+    for the bound on the submitted jobs and for cancellation).
+
+    Args:
+        job (dictionary). The job specification (see the module documentation).
+
+        fname (string or file-like object). Where to save the figure.
+            Default: None, i.e., return the rendered bytes
+
+        cache (:class:`RenderCache`). Cache looked up before rendering, and
+            updated after, by a thread of the event loop. Default: None
+
+        pool (:class:`RenderPool`). The pool rendering the job. Default:
+            None, i.e., a pool of processes shared by all the calls, created
+            on the first one
+
+    Returns:
+        The rendered figure as bytes if fname is None, None otherwise.
+    '''
+    loop = asyncio.get_running_loop()
+    if pool is None:
+        pool = _sharedPool()
+
+    data = key = None
+    if cache is not None:
+        # hashing the arrays and reading the disk would block the loop
+        key = await loop.run_in_executor(None, cache.key, job)
+        if key is not None:
+            data = await loop.run_in_executor(None, cache.get, key)
+    if data is None:
+        data = await pool.submit(job)
+        if key is not None:
+            await loop.run_in_executor(None, cache.put, key, data)
+    if fname is None:
+        return data
+    await loop.run_in_executor(None, _write, fname, data)
+    return None
+
+
+def render_many(jobs, out_dir, workers=None, cache=None):
+    '''
+    Render many jobs in parallel on a pool of processes, writing one file
+    per job in out_dir.
+
+    Arrays bigger than 64KiB found in the arguments of the calls are copied
+    once in shared memory and read by the workers from there, instead of
+    being pickled with the jobs.
+
+    Args:
+        jobs (iterable). The job specifications (see the module documentation).
+
+        out_dir (string). The output directory, created if missing.
+
+        workers (int). Number of worker processes. With 1 the jobs are
+            rendered in the calling process. Default: None, i.e., the number
+            of CPUs
+
+        cache (:class:`RenderCache`). Cache looked up by the calling process
+            before dispatching the jobs: the jobs found are written straight
+            to out_dir, with a build time of 0, the others are rendered and
+            then stored. Default: None
+
+    Returns:
+        The list of :class:`RenderResult`, in the same order as jobs.
+    '''
+    jobs = [dict(job, name=str(job.get('name', i))) for i, job in enumerate(jobs)]
+    if not os.path.isdir(out_dir):
+        os.makedirs(out_dir)
+
+    if cache is None:
+        return _renderMany(jobs, out_dir, workers)
+
+    results = [None] * len(jobs)
+    keys = {}
+    for i, job in enumerate(jobs):
+        start = time.perf_counter()
+        key = cache.key(job)
+        data = None if key is None else cache.get(key)
+        if data is None:
+            keys[i] = key
+        else:
+            path = _outputPath(job, out_dir)
+            _write(path, data)
+            results[i] = RenderResult(job['name'], path, 0., time.perf_counter() - start, None)
+
+    pending = sorted(keys)
+    for i, result in zip(pending, _renderMany([jobs[i] for i in pending], out_dir, workers)):
+        if result.error is None and keys[i] is not None:
+            with open(result.path, 'rb') as f:
+                cache.put(keys[i], f.read())
+        results[i] = result
+    return results
+
+
+# #################
+# Private Functions
+# #################
+
+def _renderMany(jobs, out_dir, workers):
+    '''
+    Render the jobs of :func:`render_many` on a pool of processes (in the
+    calling process if workers is 1), returning their :class:`RenderResult`.
+    '''
+    if workers == 1 or not jobs:
+        return [_renderJob(job, out_dir) for job in jobs]
+
+    from multiprocessing.shared_memory import SharedMemory
+
+    blocks = []
+
+    def share(value):
+        if isinstance(value, np.ndarray) and value.nbytes >= _SHARED_MIN_BYTES \
+                and value.dtype != object:
+            block = SharedMemory(create=True, size=value.nbytes)
+            blocks.append(block)
+            np.ndarray(value.shape, value.dtype, buffer=block.buf)[...] = value
+            return _SharedArray(block.name, value.shape, value.dtype.str)
+        return _mapArrays(value, share)
+
+    try:
+        jobs = [dict(job, calls=share(job['calls'])) for job in jobs]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_renderJob, job, out_dir) for job in jobs]
+            return [future.result() for future in futures]
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+def _mapArrays(value, func):
+    '''
+    Apply func to all the items of the (possibly nested) tuples, lists and
+    dictionaries in value.
+    '''
+    if isinstance(value, dict):
+        return dict((key, func(item)) for key, item in value.items())
+    if type(value) in (tuple, list):  # pylint: disable=unidiomatic-typecheck
+        return type(value)(func(item) for item in value)
+    return value
+
+
+def _hashValue(digest, value):
+    '''
+    Feed value to digest: arrays with their dtype, shape and bytes, tuples,
+    lists and dictionaries item by item, scalars with their repr, colormaps
+    with their table of colors and norms with their parameters. Return False
+    (leaving the digest incomplete) if value holds any other object, which
+    cannot be hashed by its content, True otherwise.
+    '''
+    if isinstance(value, np.ndarray):
+        digest.update(('a%s%r' % (value.dtype.str, value.shape)).encode())
+        if value.dtype == object:
+            return all(_hashValue(digest, item) for item in value.ravel())
+        if value.flags.c_contiguous:
+            digest.update(value.reshape(-1).view(np.uint8))
+        else:
+            # copy the strided arrays (e.g. the columns of a memmap) by pieces
+            for chunk in np.nditer(value, flags=['external_loop', 'buffered', 'zerosize_ok'],
+                                   order='C',
+                                   buffersize=max(_HASH_CHUNK_BYTES // value.itemsize, 1)):
+                digest.update(chunk.view(np.uint8))
+        return True
+    if isinstance(value, dict):
+        digest.update(b'd%d' % len(value))
+        for key in sorted(value, key=repr):
+            if not (_hashValue(digest, key) and _hashValue(digest, value[key])):
+                return False
+        return True
+    if isinstance(value, (tuple, list)):
+        digest.update(b'l%d' % len(value))
+        return all(_hashValue(digest, item) for item in value)
+    if isinstance(value, _HASH_SCALARS):
+        text = repr(value).encode()
+        digest.update(b'r%d:' % len(text) + text)
+        return True
+    if isinstance(value, Colormap):
+        digest.update(b'c')
+        return _hashValue(digest, (value(np.arange(value.N)), value.get_bad(),
+                                   value.get_under(), value.get_over()))
+    if isinstance(value, (Normalize, ScaleBase, TransformNode)):
+        # the type and the attributes, as the scale of the norms made from a
+        # scale (e.g. LogNorm) and its transform
+        digest.update(('o%s.%s' % (type(value).__module__, type(value).__qualname__)).encode())
+        return _hashValue(digest, dict((name, attribute) for name, attribute in vars(value).items()
+                                       if name not in _HASH_IGNORED))
+    return False
+
+
+def _sharedPool():
+    '''
+    Return the :class:`RenderPool` of :func:`render_async`, creating it on
+    the first call.
+    '''
+    global _defaultPool  # pylint: disable=global-statement
+    with _defaultPoolLock:
+        if _defaultPool is None:
+            _defaultPool = RenderPool()
+        return _defaultPool
+
+
+def _write(fname, data):
+    '''
+    Write data to a file name or to a file-like object.
+    '''
+    if hasattr(fname, 'write'):
+        fname.write(data)
+    else:
+        with open(fname, 'wb') as f:
+            f.write(data)
+
+
+def _outputPath(job, out_dir):
+    '''
+    Return the output file of a job of :func:`render_many`.
+    '''
+    return os.path.join(out_dir, '%s.%s' % (job['name'], job.get('format', 'png')))
+
+
+def _render(job, fname=None):
+    '''
+    Render a job, returning the rendered bytes (None if saved to fname) and
+    the build and render times.
+    '''
+    start = time.perf_counter()
+    proj = _reusableProj()
+    try:
+        # pylint: disable=protected-access
+        proj._fig.set_size_inches(job.get('figsize') or matplotlib.rcParams['figure.figsize'])
+        for call in job['calls']:
+            method, args = call[0], call[1]
+            kwargs = call[2] if len(call) > 2 else {}
+            if method not in _JOB_METHODS:
+                raise ValueError("render: unknown method '%s'" % method)
+            getattr(proj, method)(*args, **kwargs)
+        if job.get('limits'):
+            proj.limits.set(**job['limits'])
+        built = time.perf_counter()
+
+        savefig = dict(job.get('savefig') or {}, format=job.get('format', 'png'))
+        if fname is None:
+            result = proj.to_bytes(**savefig)
+        else:
+            result = proj.savefig(fname, **savefig)
+    finally:
+        proj.reset()
+    return result, built - start, time.perf_counter() - built
+
+
+def _reusableProj():
+    '''
+    Return the headless :class:`~orthoproj.OrthoProj` of the calling thread,
+    reset after every job so that it is built only once.
+    '''
+    proj = getattr(_local, 'proj', None)
+    if proj is None:
+        proj = _local.proj = OrthoProj(headless=True)
+    return proj
+
+
+def _renderJob(job, out_dir):
+    '''
+    Render a job of :func:`render_many`, attaching to the shared memory
+    blocks of its arrays, and return its :class:`RenderResult`.
+    '''
+    blocks = []
+
+    def attach(value):
+        if isinstance(value, _SharedArray):
+            block = _attachSharedMemory(value.name)
+            blocks.append(block)
+            return np.ndarray(value.shape, np.dtype(value.dtype), buffer=block.buf)
+        return _mapArrays(value, attach)
+
+    path = _outputPath(job, out_dir)
+    try:
+        job = dict(job, calls=attach(job['calls']))
+        _, buildTime, renderTime = _render(job, path)
+        return RenderResult(job['name'], path, buildTime, renderTime, None)
+    except Exception as error:  # pylint: disable=broad-except
+        return RenderResult(job['name'], path, None, None, repr(error))
+    finally:
+        # the arrays must be released before closing their blocks
+        del job
+        gc.collect()
+        for block in blocks:
+            block.close()
+
+
+def _attachSharedMemory(name):
+    '''
+    Attach to an existing shared memory block, owned by the parent process.
+    '''
+    from multiprocessing.shared_memory import SharedMemory
+    try:
+        return SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13: the block is registered again with the resource
+        # tracker shared with the parent, which unlinks it
+        return SharedMemory(name=name)
@@ -107,9 +107,11 @@ setup(
         'Topic :: Scientific/Engineering :: Visualization',
         'License :: OSI Approved :: MIT License',
         'Programming Language :: Python',
-        'Programming Language :: Python :: 2',
         'Programming Language :: Python :: 3',
+        'Programming Language :: Python :: 3 :: Only',
     ],
     keywords=['orthogonal projections', 'visualisation', 'plot'],
-    install_requires=['matplotlib'],
+    python_requires='>=3.9',
+    # matplotlib 3.6 draws the contours with contourpy
+    install_requires=['matplotlib>=3.6', 'numpy>=1.19'],
 )
@@ -0,0 +1,75 @@
+import hashlib
+
+import matplotlib
+import matplotlib.style
+import numpy as np
+import pytest
+from matplotlib.colors import LinearSegmentedColormap, LogNorm, Normalize
+
+from orthoproj import RenderCache
+from orthoproj.render import _hashValue
+
+
+def hashed(value):
+    digest = hashlib.blake2b(digest_size=20)
+    assert _hashValue(digest, value)
+    return digest.hexdigest()
+
+
+def colormap(name='map'):
+    return LinearSegmentedColormap.from_list(name, ['r', 'g', 'b'])
+
+
+@pytest.mark.parametrize('make', [
+    lambda: np.arange(12.).reshape(3, 4),
+    lambda: np.arange(24.).reshape(4, 6)[::2, 1::2],
+    lambda: colormap(),
+    lambda: Normalize(0., 2.),
+    lambda: LogNorm(1., 10.),
+    lambda: {'kwargsShared': {'cmap': colormap(), 'norm': LogNorm(1., 10.), 'c': [1, 2]}},
+], ids=['array', 'strided', 'colormap', 'norm', 'lognorm', 'kwargs'])
+def test_equal_content_gives_equal_keys(make):
+    # distinct objects, at distinct addresses
+    first, second = make(), make()
+    assert first is not second
+    assert hashed(first) == hashed(second)
+
+
+def test_strided_array_hashes_as_its_copy():
+    array = np.arange(24.).reshape(4, 6)[::2, 1::2]
+    assert hashed(array) == hashed(np.ascontiguousarray(array))
+
+
+@pytest.mark.parametrize('first, second', [
+    (np.arange(12.), np.arange(12.) + 1.),
+    (np.arange(12.), np.arange(12.).reshape(3, 4)),
+    (np.arange(12.), np.arange(12)),
+    (colormap(), LinearSegmentedColormap.from_list('map', ['r', 'g', 'c'])),
+    (Normalize(0., 2.), Normalize(0., 3.)),
+    (Normalize(1., 10.), LogNorm(1., 10.)),
+    ((1, 2), (2, 1)),
+    ({'a': 1}, {'b': 1}),
+], ids=['values', 'shape', 'dtype', 'colormap', 'norm', 'norm-type', 'order', 'dict'])
+def test_different_content_gives_different_keys(first, second):
+    assert hashed(first) != hashed(second)
+
+
+def test_objects_without_content_are_not_hashed():
+    digest = hashlib.blake2b()
+    assert not _hashValue(digest, {'func': lambda x: x})
+
+
+def test_key_follows_the_rcparams():
+    job = {'calls': [('plot', (np.arange(12.).reshape(4, 3),))]}
+    cache = RenderCache()
+    key = cache.key(job)
+    assert cache.key(dict(job)) == key
+    with matplotlib.rc_context({'lines.linewidth': 3.}):
+        assert cache.key(job) != key
+    with matplotlib.rc_context({'font.family': 'serif'}):
+        assert cache.key(job) != key
+    with matplotlib.rc_context({'figure.dpi': 50.}):
+        assert cache.key(job) != key
+    with matplotlib.style.context('ggplot'):
+        assert cache.key(job) != key
+    assert cache.key(job) == key
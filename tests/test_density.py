@@ -0,0 +1,30 @@
+import numpy as np
+
+from orthoproj import OrthoProj
+
+
+def densityImage(proj, points, **kwargs):
+    handle = proj.scatter(points, mode="density", **kwargs)
+    return handle, handle.artists[0]
+
+
+def test_artist_update_sets_properties():
+    with OrthoProj(headless=True) as proj:
+        _, image = densityImage(proj, np.random.default_rng(0).normal(size=(1000, 3)))
+        image.update({'alpha': 0.5})
+        assert image.get_alpha() == 0.5
+
+
+def test_refresh_bins_the_visible_range():
+    points = np.random.default_rng(1).normal(size=(1000, 3))
+    with OrthoProj(headless=True) as proj:
+        handle, image = densityImage(proj, points)
+        assert image.get_array().sum() == len(points)
+
+        proj.limits.set(x=(0., 10.), z=(0., 10.))
+        image.refresh()
+        inside = (points[:, 0] >= 0.) & (points[:, 2] >= 0.)
+        assert image.get_array().sum() == inside.sum()
+
+        handle.set_data(*points[:10].T)
+        assert image.get_array().sum() == inside[:10].sum()
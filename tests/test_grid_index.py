@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+from matplotlib.transforms import Affine2D, IdentityTransform
+
+from orthoproj.orthogonal_projection import _GridIndex
+
+
+def dataset(kind):
+    rng = np.random.default_rng(0)
+    if kind == 'uniform':
+        return rng.uniform(-1., 1., size=(5000, 2))
+    if kind == 'clustered':
+        points = np.concatenate((rng.normal(0., 0.01, size=(4000, 2)),
+                                 rng.uniform(-10., 10., size=(1000, 2))))
+        points[rng.choice(len(points), 50, replace=False)] = np.nan
+        return points
+    # a vertical line, with duplicated points
+    points = np.zeros((3000, 2))
+    points[:, 1] = np.repeat(np.linspace(0., 1., 1000), 3)
+    return points
+
+
+KINDS = ['uniform', 'clustered', 'degenerate']
+
+
+@pytest.mark.parametrize('kind', KINDS)
+def test_candidates_hold_the_points_in_the_box(kind):
+    points = dataset(kind)
+    index = _GridIndex(points)
+    rng = np.random.default_rng(1)
+    for _ in range(50):
+        umin, umax = np.sort(rng.uniform(-1.5, 1.5, size=2))
+        vmin, vmax = np.sort(rng.uniform(-1.5, 1.5, size=2))
+        with np.errstate(invalid='ignore'):
+            inside = np.flatnonzero((points[:, 0] >= umin) & (points[:, 0] <= umax) &
+                                    (points[:, 1] >= vmin) & (points[:, 1] <= vmax))
+        candidates = index.candidates(umin, umax, vmin, vmax)
+        assert len(np.unique(candidates)) == len(candidates)
+        assert np.isin(inside, candidates).all()
+        assert np.isfinite(points[candidates]).all()
+
+
+@pytest.mark.parametrize('kind', KINDS)
+@pytest.mark.parametrize('transform', [IdentityTransform(), Affine2D().scale(400., 300.)],
+                         ids=['identity', 'scaled'])
+def test_nearest_matches_brute_force(kind, transform):
+    points = dataset(kind)
+    index = _GridIndex(points)
+    display = transform.transform(points)
+    rng = np.random.default_rng(2)
+    radius = 0.05 * np.nanmax(np.abs(display))
+    hits = 0
+    for x, y in transform.transform(rng.uniform(-1.2, 1.2, size=(100, 2))):
+        distances = np.hypot(display[:, 0] - x, display[:, 1] - y)
+        found = index.nearest(transform, x, y, radius)
+        if not np.nanmin(distances) <= radius:
+            assert found is None
+            continue
+        best = np.nanargmin(distances)
+        assert found == (best, pytest.approx(distances[best]))
+        hits += 1
+    assert hits
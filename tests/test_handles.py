@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+from orthoproj import OrthoProj
+
+
+def points(count, seed=0):
+    return np.random.default_rng(seed).uniform(size=(count, 3))
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'c': np.linspace(0., 1., 20)},
+    {'c': np.random.default_rng(1).uniform(size=(20, 3))},
+    {'c': ['r', 'g'] * 10},
+    {'s': np.linspace(1., 50., 20)},
+    {'edgecolors': np.random.default_rng(2).uniform(size=(20, 4))},
+    {'linewidths': np.linspace(0.5, 2., 20)},
+], ids=['c-values', 'c-rgb', 'c-names', 's', 'edgecolors', 'linewidths'])
+def test_scatter_per_point_kwargs(kwargs):
+    with OrthoProj(headless=True) as proj:
+        handle = proj.scatter(points(20), kwargsShared=kwargs)
+        proj.to_bytes()
+
+        handle.append(*points(5, 3).T)
+        proj.to_bytes()
+        handle.set_data(*points(7, 4).T)
+        proj.to_bytes()
+
+        key, values = next(iter(kwargs.items()))
+        for artist in handle.artists[:3]:
+            if key == 'c' and np.ndim(values) == 1 and not isinstance(values[0], str):
+                drawn = artist.get_array()
+            elif key == 's':
+                drawn = artist.get_sizes()
+            elif key == 'linewidths':
+                drawn = artist.get_linewidths()
+            elif key == 'edgecolors':
+                drawn = artist.get_edgecolor()
+            else:
+                drawn = artist.get_facecolor()
+            assert len(drawn) == 7
+
+
+def test_scatter_windowed_per_point_kwargs():
+    with OrthoProj(headless=True) as proj:
+        handle = proj.scatter(points(10), kwargsShared={'s': np.arange(10.)}, window=10)
+        handle.append(*points(25, 5).T)
+        assert len(handle.artists[0].get_sizes()) == 10
+        proj.to_bytes()
+
+
+@pytest.mark.parametrize('method', ['plot', 'scatter'])
+def test_append_outside_limits(method):
+    with OrthoProj(headless=True) as proj:
+        handle = getattr(proj, method)(points(20))
+        handle.append(5., -3., 2.)
+        for coord, value in (('x', 5.), ('y', -3.), ('z', 2.)):
+            low, high = getattr(proj.limits, coord)
+            assert low < value < high
+        assert proj._axisXZ.get_xlim()[1] > 5.
+        assert proj._axisXY.get_ylim()[0] < -3.
+
+        handle.set_data(*points(20).T)
+        assert proj.limits.x[1] < 5.
+
+
+def test_append_keeps_the_user_limits():
+    with OrthoProj(headless=True) as proj:
+        handle = proj.scatter(points(20))
+        proj._axisXZ.set_xlim(0.25, 0.5)
+        handle.append(5., 0.5, 0.5)
+        assert proj.limits.x == (0.25, 0.5)
+        assert proj._axisXY.get_xlim() == (0.25, 0.5)
+        low, high = proj.limits.z
+        assert high < 1.5
+
+
+def test_append_next_to_density_images():
+    with OrthoProj(headless=True) as proj:
+        proj.scatter(points(1000), mode="density")
+        proj.plot(points(20), lod=True)
+        handle = proj.scatter(points(20))
+        ranges = [proj.limits.x]
+        for _ in range(3):
+            handle.append(0.5, 0.5, 0.5)
+            ranges.append(proj.limits.x)
+        assert ranges[1:] == ranges[:1] * 3
@@ -0,0 +1,45 @@
+import numpy as np
+
+from orthoproj import OrthoProj
+
+
+def test_limits_are_synchronised_immediately():
+    with OrthoProj(headless=True) as proj:
+        proj.plot(np.random.default_rng(0).normal(size=(100, 3)))
+        axisXZ, axisYZ, axisXY = proj._axisXZ, proj._axisYZ, proj._axisXY
+
+        axisXZ.set_xlim(-0.5, 0.25)
+        assert axisXY.get_xlim() == (-0.5, 0.25)
+        assert proj._axis3D.get_xlim() == (-0.5, 0.25)
+        assert proj.limits.x == (-0.5, 0.25)
+
+        axisXZ.set_ylim(0.5, 1.5)
+        assert axisYZ.get_ylim() == (0.5, 1.5)
+        assert proj._axis3D.get_zlim() == (0.5, 1.5)
+
+
+def test_interactions_are_counted_per_draw():
+    with OrthoProj(headless=True, instrument=True) as proj:
+        proj.plot(np.random.default_rng(0).normal(size=(100, 3)))
+        proj._fig.canvas.draw()
+        proj.stats(reset=True)
+
+        proj._axisXZ.set_xlim(-0.5, 0.25)
+        proj._axisXZ.set_ylim(0.5, 1.5)
+        proj._fig.canvas.draw()
+        proj._fig.canvas.draw()
+        assert proj.stats()['interactions'] == [2]
+
+
+def test_batch_uses_the_margins_of_each_coordinate():
+    points = np.array([[0., 0., 0.], [1., 2., 4.]])
+    with OrthoProj(headless=True) as proj:
+        for _, axis in proj._panes():
+            axis.margins(0.)
+        proj._axisYZ.set_ymargin(0.25)
+        proj._axisXY.set_xmargin(0.1)
+        with proj.batch():
+            proj.plot(points)
+        assert np.allclose(proj.limits.x, (-0.1, 1.1))
+        assert np.allclose(proj.limits.y, (0., 2.))
+        assert np.allclose(proj.limits.z, (-1., 5.))
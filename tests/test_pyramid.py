@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from orthoproj import OrthoProj
+from orthoproj.orthogonal_projection import _Chunks, _MinMaxPyramid, _ProjectedChunks
+
+# not a multiple of the buckets, nor of the chunks
+COUNT = 10037
+CHUNK = 1000
+LEAF = 64
+
+
+@pytest.fixture(scope='module')
+def line():
+    rng = np.random.default_rng(0)
+    points = np.column_stack((np.arange(COUNT, dtype=float),
+                              np.cumsum(rng.normal(size=COUNT)),
+                              rng.normal(size=COUNT)))
+    points[rng.choice(COUNT, 20, replace=False), 1] = np.nan
+    with OrthoProj(headless=True) as proj:
+        # the XY view draws the x and y columns
+        view = proj._projector.views[2]
+        pyramid = _MinMaxPyramid(_ProjectedChunks(_Chunks(points, size=CHUNK), view), leaf=LEAF)
+    return points[:, :2], pyramid
+
+
+def bruteExtrema(points, start, stop):
+    part = points[start:stop]
+    return (np.nanmin(part[:, 0]), np.nanmax(part[:, 0]),
+            np.nanmin(part[:, 1]), np.nanmax(part[:, 1]))
+
+
+def test_levels_match_brute_force(line):
+    points, pyramid = line
+    assert pyramid.count == COUNT
+    for level, (extrema, indexes) in enumerate(pyramid.levels):
+        size = LEAF << level
+        assert len(extrema) == -(-COUNT // size)
+        for bucket in range(len(extrema)):
+            start, stop = bucket * size, min((bucket + 1) * size, COUNT)
+            expected = bruteExtrema(points, start, stop)
+            assert tuple(extrema[bucket, k, k // 2]
+                         for k in range(4)) == pytest.approx(expected)
+            np.testing.assert_array_equal(points[indexes[bucket]], extrema[bucket])
+            assert (indexes[bucket, 4], indexes[bucket, 5]) == (start, stop - 1)
+
+
+@pytest.mark.parametrize('box', [
+    (-np.inf, np.inf, -np.inf, np.inf),
+    (1000.5, 5321.3, -np.inf, np.inf),
+    (0., 63.5, -np.inf, np.inf),
+    (9990.2, np.inf, -np.inf, np.inf),
+    (130.7, 131.2, -np.inf, np.inf),
+    (2000.1, 8000.9, -5., 5.),
+])
+@pytest.mark.parametrize('nbins', [3, 40, 400])
+def test_decimation_matches_brute_force(line, box, nbins):
+    points, pyramid = line
+    umin, umax, vmin, vmax = box
+    inside = np.flatnonzero((points[:, 0] >= umin) & (points[:, 0] <= umax) &
+                            (points[:, 1] >= vmin) & (points[:, 1] <= vmax))
+    kept = pyramid.decimate(box, nbins)
+    # the kept points are points of the line, in order
+    indexes = np.searchsorted(points[:, 0], kept[:, 0])
+    np.testing.assert_array_equal(points[indexes], kept)
+    assert (np.diff(indexes) > 0).all()
+    # with the points in the box and a bucket around them
+    if len(inside):
+        assert indexes[0] <= inside[0] and indexes[-1] >= inside[-1]
+
+    span = pyramid._span(box, nbins)
+    if span is None or span[2] - span[1] < nbins:
+        # zoomed in beyond the finest level: the points are decimated directly
+        return
+    level, start, stop = span
+    size = LEAF << level
+    assert start * size <= inside[0] and inside[-1] < stop * size
+    for bucket in range(max(start - 1, 0), min(stop + 1, len(pyramid.levels[level][0]))):
+        low, high = bucket * size, min((bucket + 1) * size, COUNT)
+        part = kept[(indexes >= low) & (indexes < high)]
+        assert bruteExtrema(part, 0, len(part)) == pytest.approx(
+            bruteExtrema(points, low, high))
@@ -0,0 +1,51 @@
+import threading
+
+import numpy as np
+
+from orthoproj import OrthoProj, render
+
+
+def inThread(func):
+    result = []
+    thread = threading.Thread(target=lambda: result.append(func()))
+    thread.start()
+    thread.join()
+    return result[0]
+
+
+def test_reused_figure_renders_as_a_new_one():
+    rng = np.random.default_rng(0)
+    points = rng.normal(size=(200, 3))
+    X, Y = np.meshgrid(np.linspace(-1., 1., 10), np.linspace(-1., 1., 10))
+    jobA = {'name': 'a', 'calls': [
+        ('scatter', (points * 10.,), {'kwargsShared': {'c': points[:, 0]}}),
+        ('plot', (points[:50],)),
+        ('plot_surface', (X, Y, X * Y)),
+    ], 'limits': {'x': (-5., 5.)}}
+    jobB = {'name': 'b', 'calls': [('plot', (points[:20],)), ('plot', (points[20:40],))]}
+
+    cold = inThread(lambda: render(jobB))
+    warm = inThread(lambda: (render(jobA), render(jobB))[1])
+    assert warm == cold
+
+
+def test_reset_restores_a_new_figure():
+    points = np.random.default_rng(1).uniform(size=(20, 3))
+
+    def jobB(proj):
+        with proj.batch():
+            proj.plot(points)
+        proj.plot(points + 1.)
+        return ([axis.margins() for _, axis in proj._panes()],
+                [axis.get_autoscale_on() for _, axis in proj._panes()],
+                proj.limits.x, proj.limits.y, proj.limits.z,
+                [line.get_color() for line in proj._axisXZ.lines])
+
+    with OrthoProj(headless=True) as proj:
+        cold = jobB(proj)
+    with OrthoProj(headless=True) as proj:
+        proj.scatter(points * 10.)
+        proj.plot(points)
+        proj._axisXZ.set_xlim(-5., 5.)
+        proj.reset()
+        assert jobB(proj) == cold
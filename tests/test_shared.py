@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from orthoproj import OrthoProj
+from orthoproj import orthogonal_projection
+
+
+@pytest.fixture(params=[True, False], ids=['shared', 'copied'])
+def shared(request, monkeypatch):
+    monkeypatch.setattr(orthogonal_projection, '_SHARE_DATA', request.param)
+    return request.param
+
+
+def checkArtists(handle, points):
+    lineXZ, lineYZ, lineXY = handle.artists[:3]
+    for artist, columns in ((lineXZ, [0, 2]), (lineYZ, [1, 2]), (lineXY, [0, 1])):
+        if hasattr(artist, 'get_offsets'):
+            drawn = artist.get_offsets()
+        else:
+            drawn = artist.get_xydata()
+        np.testing.assert_array_equal(drawn, points[:, columns])
+
+
+@pytest.mark.parametrize('method', ['plot', 'scatter'])
+def test_artists_follow_the_data(shared, method):
+    points = np.random.default_rng(0).normal(size=(50, 3))
+    with OrthoProj(headless=True) as proj:
+        handle = getattr(proj, method)(points.copy())
+        checkArtists(handle, points)
+        assert np.shares_memory(handle.artists[2].get_xydata() if method == 'plot'
+                                else handle.artists[2].get_offsets(), handle.data) == shared
+
+        handle.data[:] *= 2
+        handle.refresh()
+        checkArtists(handle, points * 2)
+
+        handle.set_data(*points[:10].T)
+        checkArtists(handle, points[:10])
+        if method == 'scatter':
+            np.testing.assert_array_equal(np.column_stack(handle.artists[3]._offsets3d),
+                                          points[:10])
+        proj.to_bytes()
+
+
+def test_line_setters(shared):
+    points = np.random.default_rng(1).normal(size=(20, 3))
+    with OrthoProj(headless=True) as proj:
+        line = proj.plot(points).artists[0]
+        line.set_xdata(np.arange(20.))
+        np.testing.assert_array_equal(line.get_xydata(),
+                                      np.column_stack((np.arange(20.), points[:, 2])))
+        line.set_data([0., 1.], [2., 3.])
+        np.testing.assert_array_equal(line.get_xydata(), [[0., 2.], [1., 3.]])
+        line.set_drawstyle('steps')
+        proj.to_bytes()
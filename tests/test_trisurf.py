@@ -0,0 +1,23 @@
+import numpy as np
+from matplotlib.tri import Triangulation
+
+from orthoproj import OrthoProj
+
+
+def test_wireframe_draws_each_edge_once():
+    rng = np.random.default_rng(0)
+    x, y = rng.uniform(size=(2, 50))
+    triangles = Triangulation(x, y).triangles[::2]
+    expected = set(tuple(sorted(edge)) for triangle in triangles.tolist()
+                   for edge in zip(triangle, triangle[1:] + triangle[:1]))
+
+    with OrthoProj(headless=True) as proj:
+        proj.plot_trisurf(x, y, x * y, triangles=triangles)
+        path = proj._axisXY.collections[0].get_paths()[0]
+        segments = path.vertices.reshape(-1, 3, 2)[:, :2]
+
+    points = np.column_stack((x, y))
+    drawn = [tuple(sorted(int(np.flatnonzero((points == end).all(axis=1))[0]) for end in segment))
+             for segment in segments]
+    assert len(drawn) == len(expected)
+    assert set(drawn) == expected
@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from orthoproj.orthogonal_projection import _projectVolume
+
+REDUCTIONS = {'max': np.max, 'mean': np.mean, 'sum': np.sum}
+
+
+def volumes():
+    rng = np.random.default_rng(0)
+    volume = rng.uniform(size=(7, 5, 9))
+    yield 'C', volume
+    yield 'F', np.asfortranarray(volume)
+    yield 'transposed', volume.transpose(2, 0, 1)
+    yield 'strided', volume[::2, :, 1::2]
+    yield 'integers', rng.integers(0, 100, size=(7, 5, 9)).astype(np.int16)
+
+
+def expected(volume, reduce):
+    func = REDUCTIONS[reduce]
+    return func(volume, axis=1).T, func(volume, axis=0).T, func(volume, axis=2).T
+
+
+@pytest.mark.parametrize('name, volume', list(volumes()), ids=[name for name, _ in volumes()])
+@pytest.mark.parametrize('reduce', sorted(REDUCTIONS))
+@pytest.mark.parametrize('planes, workers', [(1, 1), (1, 2), (2, 3), (3, 2), (None, 4)],
+                         ids=['one-plane', 'one-plane-2', 'odd-slabs', 'partial-slab',
+                              'single-slab'])
+def test_projections_match_numpy(name, volume, reduce, planes, workers):
+    # slabs of the given number of planes along the axis with the largest
+    # stride, or the whole volume in one slab
+    axis = int(np.argmax(np.abs(volume.strides)))
+    plane = volume.size // volume.shape[axis] * volume.itemsize
+    size = volume.size * volume.itemsize * 2 if planes is None else planes * plane
+    images = _projectVolume(volume, reduce, workers=workers, size=size)
+    for image, reference in zip(images, expected(volume, reduce)):
+        assert image.shape == reference.shape
+        np.testing.assert_allclose(image, reference)